@@ -8,6 +8,7 @@ import time
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
@@ -622,6 +623,10 @@ URL: {url}
             primary_model
         )
 
+        # The prompt is sent verbatim: no template parsing per attempt, and literal
+        # braces in article text cannot be mistaken for template variables
+        messages = [HumanMessage(content=prompt)]
+
         # Try primary model with retries
         for attempt in range(max_retries):
             try:
@@ -630,13 +635,7 @@ URL: {url}
                 # Get client
                 client = self._get_client(primary_model)
 
-                prompt_template = ChatPromptTemplate.from_messages([
-                    ("human", prompt),
-                ])
-
-                formatted_prompt = prompt_template.format_messages()
-
-                response = await self._ainvoke_json(client, formatted_prompt, primary_model)
+                response = await self._ainvoke_json(client, messages, primary_model)
 
                 processing_time = time.time() - start_time
 
@@ -676,13 +675,7 @@ URL: {url}
 
                 client = self._get_client(fallback_model)
 
-                prompt_template = ChatPromptTemplate.from_messages([
-                    ("human", prompt),
-                ])
-
-                formatted_prompt = prompt_template.format_messages()
-
-                response = await self._ainvoke_json(client, formatted_prompt, fallback_model)
+                response = await self._ainvoke_json(client, messages, fallback_model)
 
                 processing_time = time.time() - start_time
 
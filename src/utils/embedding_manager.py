@@ -191,6 +191,30 @@ class EmbeddingManager:
         except Exception as e:
             logger.error("Failed to save FAISS index", error=str(e))
 
+    def _embedding_params(self, text_input: str | list[str]) -> dict:
+        """Build OpenAI embedding request parameters for one or many texts."""
+
+        # Prepare embedding parameters
+        embedding_params = {
+            "model": self.model,
+            "input": text_input,
+            "encoding_format": "float"
+        }
+
+        # Add dimensions parameter for text-embedding-3-* models
+        if "text-embedding-3" in self.model and self.dimension != 3072:
+            embedding_params["dimensions"] = self.dimension
+
+        return embedding_params
+
+    @staticmethod
+    def _clean_text(text: str) -> str:
+        """Clean and prepare text for the embedding API."""
+        clean_text = text.replace('\n', ' ').strip()
+        if len(clean_text) > 8000:  # OpenAI limit
+            clean_text = clean_text[:8000]
+        return clean_text
+
     async def generate_embedding(self, text: str) -> np.ndarray | None:
         """Generate embedding for text using OpenAI API."""
 
@@ -200,23 +224,10 @@ class EmbeddingManager:
 
         try:
             # Clean and prepare text
-            clean_text = text.replace('\n', ' ').strip()
-            if len(clean_text) > 8000:  # OpenAI limit
-                clean_text = clean_text[:8000]
-
-            # Prepare embedding parameters
-            embedding_params = {
-                "model": self.model,
-                "input": clean_text,
-                "encoding_format": "float"
-            }
-
-            # Add dimensions parameter for text-embedding-3-* models
-            if "text-embedding-3" in self.model and self.dimension != 3072:
-                embedding_params["dimensions"] = self.dimension
+            clean_text = self._clean_text(text)
 
             # Generate embedding
-            response = self.openai_client.embeddings.create(**embedding_params)
+            response = self.openai_client.embeddings.create(**self._embedding_params(clean_text))
 
             embedding = np.array(response.data[0].embedding, dtype=np.float32)
 
@@ -237,6 +248,50 @@ class EmbeddingManager:
             logger.error("Failed to generate embedding", error=str(e))
             return None
 
+    async def generate_embeddings_batch(self, texts: list[str]) -> list[np.ndarray | None]:
+        """
+        Generate embeddings for many texts with a single OpenAI request.
+
+        Falls back to one request per text if the batch request fails.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Normalized embeddings in input order (None where generation failed)
+        """
+
+        if not texts:
+            return []
+
+        if not self.openai_client:
+            logger.warning("OpenAI client not available")
+            return [None] * len(texts)
+
+        try:
+            clean_texts = [self._clean_text(text) for text in texts]
+            response = self.openai_client.embeddings.create(**self._embedding_params(clean_texts))
+
+            # Results carry their input index; order them before stacking
+            ordered = sorted(response.data, key=lambda item: item.index)
+            embeddings = np.array([item.embedding for item in ordered], dtype=np.float32)
+
+            # Normalize for cosine similarity
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+            logger.debug(
+                "Generated batch embeddings",
+                batch_size=len(clean_texts),
+                model=self.model,
+                dimensions=self.dimension
+            )
+
+            return list(embeddings)
+
+        except Exception as e:
+            logger.warning("Batch embedding failed, falling back to per-text requests", error=str(e))
+            return [await self.generate_embedding(text) for text in texts]
+
     async def add_article(
         self,
         article: SummarizedArticle,
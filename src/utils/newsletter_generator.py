@@ -5,12 +5,19 @@ This module handles the generation of Markdown newsletters from processed articl
 """
 
 import asyncio
+import hashlib
+import heapq
+import io
 import json
+import logging
 import os
 import re
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate, chain
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 # Optional dependencies
 try:
@@ -19,6 +26,12 @@ try:
 except ImportError:
     HAS_MARKDOWN = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 try:
     import jinja2
     HAS_JINJA2 = True
@@ -39,11 +52,20 @@ try:
     HAS_LOGGER = True
 except ImportError:
     # Fallback logger
-    import logging
     logger = logging.getLogger(__name__)
     logger.setLevel(logging.INFO)
     HAS_LOGGER = False
 
+
+def _is_debug_enabled() -> bool:
+    """Return True if DEBUG records from the module logger would be emitted."""
+    if HAS_LOGGER:
+        # The structlog filtering logger has no level query; it filters at the
+        # stdlib root level that setup_logging configures
+        return logging.getLogger().isEnabledFor(logging.DEBUG)
+    return logger.isEnabledFor(logging.DEBUG)
+
+
 # Import text limits for title length constraints
 try:
     from src.config.settings import get_settings
@@ -74,6 +96,414 @@ try:
 except ImportError:
     HAS_ADVANCED_FEATURES = False
 
+# LLM update-confirmation decisions are reused for a week
+_UPDATE_DECISION_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Minimum character-trigram Jaccard overlap before a (current, past) pair is sent to the LLM.
+# Follow-ups of the same story (title + summary) overlap around 0.25-0.3 because they repeat
+# the entity and product names, while different stories about the same company stay near
+# 0.1; 0.15 sits between the two so only pairs without shared wording skip confirmation.
+_UPDATE_LEXICAL_THRESHOLD = 0.15
+
+# Regex patterns applied to every article / newsletter (compiled once at import)
+_RE_SEQUEL_PREFIX = re.compile(r'【?続報】?[:：]?\s*')
+_RE_TITLE_QUOTES = re.compile(r'^[#\s]*["\'「]|["\'」]+$')
+_RE_TITLE_HASH = re.compile(r'^#+\s*')
+
+# Lead text validation / grammar fixing (applied per paragraph on every LLM retry)
+# One scan for the incomplete-sentence rules. The leftmost match is always the
+# highest-priority rule except that a paragraph ending in a particle (checked
+# without regex) takes precedence over the trailing-period rule
+_RE_LEAD_INCOMPLETE = re.compile(
+    r'(?P<particle_period>^[^。！？]*[がはをにで]。)'
+    r'|(?P<subject_period>[A-Za-z\u30A0-\u30FF\u3040-\u309F\u4E00-\u9FAF]+が。)'
+    r'|(?P<trailing_period>[がはをにで]。\s*[^。！？]*$)'
+)
+_LEAD_INCOMPLETE_REASONS = {
+    'particle_period': "助詞の後に句点",
+    'subject_period': "主語の後すぐに句点",
+    'trailing_period': "文中に不完全な句点",
+}
+_LEAD_ENDING_PARTICLES = frozenset('はがをに')
+
+_RE_LEAD_REDUNDANT = re.compile(r'(されています|しています).*?(と発表|と報告|と説明)')
+_RE_DUP_ENDING = re.compile(r'([。！？])\1+')
+_RE_MISSING_PERIOD = re.compile(r'([^\s。！？])([A-Z\u3042-\u3093\u30A2-\u30F3\u4E00-\u9FAF]{3,})')
+_RE_SPLIT_CONJUNCTION = re.compile(r'([^\s。！？])(また|さらに|一方|なお|ただし|しかし)')
+_RE_DANGLING_PARTICLE = re.compile(r'[A-Za-z\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+[がはを]。\s*')
+_RE_SENTENCE_END_KEEP = re.compile(r'([。！？])')
+_RE_SENTENCE_BODY = re.compile(r'[^。！？]+')
+_RE_LEADING_NUMBER = re.compile(r'^\d+\.\s*')
+_RE_RESPONSE_LINE = re.compile(r'[^\n]+')
+_RE_PARAGRAPH_LABEL = re.compile(r'段落[^:]*:(.*)')
+_RE_JSON_BLOCK = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+_RE_RESPONSE_SKIP = re.compile(r'json|```|段落|形式', re.IGNORECASE | re.ASCII)
+_RE_ENDING_HINT = re.compile(
+    r'(?P<shimashita>発表|開始|公開|導入|提供)|(?P<desu>予定|見込み|計画|方針)|(?P<sareteimasu>期待|予想|見通し)'
+)
+
+# Company / entity names (one compiled scan per text instead of one substring test per name)
+_RE_FALLBACK_COMPANY = re.compile(r'OpenAI|Google|Meta|Microsoft|Anthropic|Apple')
+# Each group is one capturing alternative of a single pattern, so one finditer pass
+# covers every group; m.lastindex tells which group matched
+_RE_COMPANY_GROUPS = re.compile(
+    '|'.join((
+        r'(OpenAI|ChatGPT|GPT-\d+)',
+        r'(Google|Alphabet|DeepMind|Gemini)',
+        r'(Meta|Facebook|Instagram)',
+        r'(Microsoft|Azure|Copilot)',
+        r'(Apple|iPhone|iPad|macOS)',
+        r'(Amazon|AWS|Alexa)',
+        r'(NVIDIA|Tesla|SpaceX)',
+        r'(Anthropic|Claude)',
+        r'(IBM|Watson)',
+        r'(Samsung|LG|Sony)',
+    )),
+    re.IGNORECASE,
+)
+
+# Article analysis extractors (products use the same one-scan grouping as companies)
+_RE_PRODUCT_GROUPS = re.compile(
+    '|'.join((
+        r'(GPT-\d+(?:\.\d+)?|ChatGPT|GPT)',
+        r'(Claude(?:-\d+)?)',
+        r'(Gemini(?:\s+\d+\.\d+)?)',
+        r'(LLaMA|Llama)',
+        r'(DALL-E|DALL·E)',
+        r'(Midjourney|Stable Diffusion)',
+        r'(TensorFlow|PyTorch)',
+        r'(Transformer|BERT|T5)',
+    )),
+    re.IGNORECASE,
+)
+_RE_KEY_ACTIONS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        # Extract action part after company name, avoiding full sentence capture
+        r'(?:が|は)([^。]*?(?:発表|リリース|公開|開始|導入|実装|展開|提供))',
+        r'(?:が|は)([^。]*?(?:向上|改善|強化|拡大|増大|倍増))',
+        r'(?:が|は)([^。]*?(?:値下げ|価格.*?削減|コスト.*?削減))',
+        r'(?:が|は)([^。]*?(?:新機能|新サービス|新製品|新技術))',
+        # Fallback: extract just the action verb and immediate context
+        r'((?:\d+[%倍億ドル]*.*?)?(?:発表|リリース|公開|開始|導入))',
+        r'((?:\d+[%倍]*.*?)?(?:向上|改善|強化))',
+    )
+)
+_RE_METRICS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r'(\d+%(?:.*?(?:向上|改善|削減|増加|減少))?)',
+        r'(\d+倍(?:.*?(?:向上|改善|増加))?)',
+        r'(\$\d+(?:\.\d+)?(?:[MKB]illion)?)',
+        r'(v?\d+\.\d+)',
+        r'(\d+(?:GB|TB|PB))',
+    )
+)
+_RE_BUSINESS_CONTEXT = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r'([^。]*(?:企業|ビジネス|業界|市場|競争)[^。]*)',
+        r'([^。]*(?:活用|応用|導入|実用)[^。]*)',
+        r'([^。]*(?:開発者|ユーザー|顧客)[^。]*)',
+        r'([^。]*(?:影響|効果|成果|結果)[^。]*)',
+    )
+)
+_RE_HAS_DIGIT = re.compile(r'\d')  # every metric pattern needs at least one \d
+_RE_CONNECTIVE = re.compile(r'一方|また|さらに|加えて|同時に|並行して')
+_RE_ANNOUNCEMENT_CLAUSE = re.compile(r'([^。]*(?:発表|開始|導入|実装)[^。]*)')
+
+# Jinja2 filters / headline formatting
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_SLUG_SEPARATOR = re.compile(r'[^\w\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+')
+_RE_QUOTED = re.compile(r'「([^」]+)」')
+_RE_SEQUEL_LEADING = re.compile(r'^続報[:：]\s*')
+_RE_SEQUEL_INLINE = re.compile(r'続報\s*[：:]\s*')
+_RE_SEQUEL_TRAILING = re.compile(r'\s*続報$')
+_RE_HEADLINE_ENTITY = re.compile(r'「([^」]+)」|\b([A-Z][a-zA-Z0-9]+)\b')
+
+# Title quality validation / auto-improvement
+_RE_TITLE_DUP_WORD = re.compile(r'(\w+)\s+\1\b')
+_RE_TITLE_DUP_TECH = re.compile(r'(\w+)技術\s*\1')
+_RE_TITLE_DUPLICATES = (
+    (_RE_TITLE_DUP_WORD, '同じ単語が連続しています'),
+    (re.compile(r'(LLM|AI|GPT)の技術.*?\1'), 'LLM/AI用語の重複があります'),
+    (_RE_TITLE_DUP_TECH, '技術用語の重複があります'),
+)
+_RE_TITLE_DUP_LLM_TERM = re.compile(r'(LLM|AI|GPT)(の技術).*?\1')
+_RE_TITLE_GENERIC = re.compile(r'^(?:LLM（大規模言語モデル）|技術進展|AI技術|新技術)$')
+_RE_TITLE_EMOJI = re.compile(r'[�-􏰀-�☀-⟿]')
+_RE_WHITESPACE_RUN = re.compile(r'\s+')
+
+# Integrated fallback titles
+_RE_SEQUEL_CLAUSE = re.compile(r'続報.*?、')
+# Capitalised name (optionally several words) followed by a particle. This generic form
+# already matches every known name (OpenAI, Together AI, Hugging Face, IEEE, ...) with the
+# same span, so listing them as literal alternatives only added work at each position.
+_RE_FALLBACK_TITLE_COMPANY = re.compile(r'([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*?)(?:社|が|は|の|、)')
+_RE_FALLBACK_TITLE_NUMBERS = re.compile(r'(\d+(?:\.\d+)?[%万億円ドル倍件名]|Pass@1\s+\d+\.\d+%|SOTA|年間\d+万ドル)')
+# Key action patterns in priority order; each has exactly one capture group, so in the
+# lookahead scanner below match.lastindex - 1 is the index of the pattern that matched
+_FALLBACK_TITLE_ACTIONS = (
+    (r'(DeepSWE-Preview|コーディングエージェント)', 'AI開発ツール'),
+    (r'(強化学習|RL|GRPO\+\+|rLLM)', '機械学習技術'),
+    (r'(Pass@1\s+\d+\.\d+%|SOTA|ベンチマーク)', '性能指標'),
+    (r'(SWE-Bench|Qwen3-32B)', 'AI基盤'),
+    (r'(年間\d+万ドル|収益|売上|投資)', '事業展開'),
+    (r'(コンサルティング|サービス拡大)', 'ビジネス'),
+    (r'(\d+名?の?(?:AI)?研究者)', '研究者'),
+    (r'(トップ.*?研究者)', '人材'),
+    (r'(新機能|新サービス|新技術)', 'リリース'),
+    (r'(発表|公開|開始|導入|獲得|雇用)', None),
+    (r'(ChatGPT|Claude|Gemini|GPT-\d+)', 'AI'),
+    (r'(Deep Research|RAG|LLM)', '技術'),
+)
+_FALLBACK_TITLE_ACTION_TYPES = tuple(type_hint for _, type_hint in _FALLBACK_TITLE_ACTIONS)
+# At each position the alternation reports the highest-priority pattern matching there
+_RE_FALLBACK_TITLE_ACTIONS = re.compile(
+    '(?=' + '|'.join(pattern for pattern, _ in _FALLBACK_TITLE_ACTIONS) + ')'
+)
+
+# LLM title cleanup
+_RE_CLEAN_REPORTED_DUP = re.compile(r'(.+?)(と発表|と報告|と述べ|と語っ|と表明)(.*?)\2')
+_RE_CLEAN_SPACED_PRODUCT_DUP = re.compile(r'\b(\w+)\s+(AI|Code|Pro|Plus)\s+\1\b')
+_RE_CLEAN_JOINED_PRODUCT_DUP = re.compile(r'\b(\w+)(AI|Code|Pro|Plus)\1\b')
+_RE_CLEAN_ADJACENT_WORD_DUP = re.compile(r'(\b\w+)\s+\1\b')
+_RE_CLEAN_AMOUNT_DUPS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        # Pattern 9: Specific numeric/text duplicates like "年間1000万ドルで年間1000万ドル"
+        r'(年間\d+[万億千]?[ドル円])(で|を|が|は)\1',
+        r'(\d+[万億千]?[ドル円])(で|を|が|は)\1',
+        # Pattern 10: More specific duplicates with currencies and numbers
+        r'(\d+万ドル)(で|を|が|は)(\d+万ドル)',
+        r'(年間\d+万ドル)(で|を|が|は)(年間\d+万ドル)',
+    )
+)
+# Title suffixes removed by _strip_suffix (none is a suffix of another in the same tuple)
+_TITLE_VERB_SUFFIXES = (
+    'と報じられました', 'と発表しました', 'と述べました', 'と語りました', 'と表明しました',
+    'と明らかにしました', '氏は', '氏は、', 'を発表', 'を報告',
+)
+_TITLE_INCOMPLETE_SUFFIXES = ('について', 'に関して', 'において', 'に対して', 'をめぐって')
+# Trailing particles: completed with a closing phrase (keyed on the last character), or dropped
+_TITLE_PARTICLE_COMPLETIONS = {'が': 'を発表', 'を': 'が進展', 'に': 'が加速', 'で': 'が加速'}
+_TITLE_DROPPED_PARTICLES = ('は', 'と', 'での', 'のため', 'により', 'によって', 'として')
+_RE_HIGHLY_GENERIC_TITLE = re.compile(
+    '|'.join((
+        r'^AI関連ニュース$',
+        r'^最新AI動向$',
+        r'^技術ニュース$',
+        r'^業界動向$',
+        r'^最新情報$',
+        r'^.*について$',
+        r'^.*に関して$',
+        r'^.*を発表🆙$',  # Broken titles ending with emoji
+        r'^.*の$',  # Titles ending with incomplete possessive
+        r'.*を発表しながら',  # Incomplete "while announcing" patterns
+    )),
+    re.IGNORECASE,
+)
+# Companies looked for in summaries, in the order they are preferred for titles / leads
+# (plain substring checks: `in` is faster than a regex alternation at these list sizes)
+_SPECIFIC_TITLE_COMPANIES = (
+    'OpenAI', 'Google', 'Microsoft', 'Apple', 'Meta', 'Amazon', 'Anthropic',
+    'DeepMind', 'Hugging Face', 'NVIDIA', 'Intel', 'AMD', 'Tesla', 'Uber',
+)
+_SPECIFIC_LEAD_COMPANIES = (
+    'OpenAI', 'Google', 'Microsoft', 'Apple', 'Meta', 'Amazon', 'Anthropic',
+    'DeepMind', 'Hugging Face', 'NVIDIA', 'Tesla', 'AgenticaAI', 'Together AI',
+)
+_SPECIFIC_TITLE_ACTIONS = ('発表', '発売', '公開', 'リリース', '開始', '提供', '導入', '開発', '改良', '向上')
+_SPECIFIC_LEAD_ACTIONS = ('発表', 'リリース', '開発', '達成', '実現', '提供', '公開', '開始')
+
+# Summary points / headings
+_RE_BULLET_MARKER = re.compile(r'^[\-\*\•・\u2022]\s*')
+_RE_REDUNDANT_PREFIX = re.compile(r'^(また、|さらに、|なお、|一方、)')
+_RE_TOPIC_ACTIONS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r'(.{5,20}?を発表)',  # "XXXを発表"
+        r'(.{5,20}?をリリース)',  # "XXXをリリース"
+        r'(.{5,20}?を開始)',  # "XXXを開始"
+        r'(.{5,20}?を導入)',  # "XXXを導入"
+        r'(.{5,20}?が向上)',  # "XXXが向上"
+        r'(.{5,20}?を改善)',  # "XXXを改善"
+        r'(.{5,20}?に成功)',  # "XXXに成功"
+        r'(.{5,20}?を実現)',  # "XXXを実現"
+        r'(.{5,20}?が可能)',  # "XXXが可能"
+    )
+)
+_RE_TOPIC_PREFIX = re.compile(r'^(新しい|最新の|次世代の)')
+_RE_TOPIC_NOUNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r'([A-Za-z0-9]{3,}[の]?(?:API|SDK|サービス|機能|技術|システム|プラットフォーム))',
+        r'([ぁ-ん]{2,}[の]?(?:機能|技術|サービス|システム|性能|精度))',
+    )
+)
+_RE_MARKDOWN_SYNTAX = re.compile(r'[#*_`\[\]]')
+_RE_URL = re.compile(r'https?://\S+')
+_RE_TRAILING_PUNCT = re.compile(r'[.,:;!?]+$')
+# Terminology normalisation: the identity entries still canonicalise case (the match is
+# case-insensitive), so they stay. One alternation with a group per term replaces them all
+# in a single scan; match.lastindex - 1 indexes the canonical form.
+_TERMINOLOGY = (
+    # AI model names
+    (r'\bGPT[\s-]?4[\s-]?o[\s-]?mini\b', 'GPT-4o-mini'),
+    (r'\bGPT[\s-]?4[\s-]?o\b', 'GPT-4o'),
+    (r'\bGPT[\s-]?3\.5\b', 'GPT-3.5'),
+    (r'\bClaude[\s-]?3\.5\b', 'Claude 3.5'),
+    (r'\bGemini[\s-]?Pro\b', 'Gemini Pro'),
+
+    # Company names
+    (r'\bOpenAI\b', 'OpenAI'),
+    (r'\bAnthropic\b', 'Anthropic'),
+    (r'\bGoogle\b', 'Google'),
+    (r'\bMicrosoft\b', 'Microsoft'),
+    (r'\bMeta\b', 'Meta'),
+
+    # Technology terms
+    (r'\bAI\b', 'AI'),
+    (r'\bML\b', 'ML'),
+    (r'\bLLM\b', 'LLM'),
+    (r'\bAPI\b', 'API'),
+)
+_TERMINOLOGY_CANONICAL = tuple(replacement for _, replacement in _TERMINOLOGY)
+_RE_TERMINOLOGY = re.compile(
+    '|'.join(f'({pattern})' for pattern, _ in _TERMINOLOGY), re.IGNORECASE
+)
+
+# Keyword buckets matched in one scan per text: each alternative sits in a lookahead so
+# overlapping keywords are all seen, and the matched keyword maps back to its bucket
+_THEME_KEYWORDS = {
+    "OpenAI・GPT関連": ("openai", "gpt", "chatgpt"),
+    "Google・Gemini関連": ("google", "gemini", "bard"),
+    "Anthropic・Claude関連": ("anthropic", "claude"),
+    "企業・ビジネス": ("企業", "ビジネス", "投資", "資金調達", "startup"),
+    "研究・技術": ("研究", "論文", "技術", "開発", "breakthrough"),
+    "規制・政策": ("規制", "政策", "法律", "政府", "policy"),
+    "量子コンピュータ": ("量子", "quantum"),
+    "ロボティクス": ("ロボット", "robot", "自動化"),
+    "画像生成": ("画像生成", "stable diffusion", "midjourney", "dall-e"),
+}
+_IMPACT_KEYWORDS = {
+    # Major companies/products
+    "entity": (
+        'OpenAI', 'Google', 'Meta', 'Microsoft', 'Apple', 'Amazon', 'NVIDIA',
+        'Anthropic', 'DeepMind', 'GPT', 'Claude', 'Gemini', 'ChatGPT',
+    ),
+    # Impact indicators
+    "impact": (
+        '発表', 'リリース', '開始', '公開', '導入', '実装', '改善', '向上',
+        '強化', '拡大', '展開', '活用', '応用', '突破', 'breakthrough',
+    ),
+}
+_IMPACT_KEYWORD_WEIGHTS = {"entity": 2.0, "impact": 1.0}
+# Lead theme title entities as (display name, lowercased needle) pairs
+_THEME_TITLE_COMPANIES = tuple((name, name.lower()) for name in (
+    'OpenAI', 'Google', 'Meta', 'Microsoft', 'Anthropic', 'Apple',
+    'Amazon', 'Tesla', 'NVIDIA', 'DeepMind', 'LinkedIn', 'GitHub',
+))
+_THEME_TITLE_TECHNOLOGIES = tuple((name, name.lower()) for name in (
+    'ChatGPT', 'GPT-4', 'Gemini', 'Claude', 'Llama', 'Copilot',
+    'API', 'CLI', 'LLM', 'Agent', 'RAG', 'Transformer',
+))
+_HIGHLIGHT_KEYWORDS = {
+    "llm": ('LLM', 'GPT', '言語モデル', 'AI'),
+    "business": ('企業', 'ビジネス', '導入', '活用'),
+    "research": ('研究', '開発', '技術', '性能'),
+}
+
+
+def _keyword_bucket_scanner(buckets: dict[str, tuple[str, ...]]) -> tuple[re.Pattern, dict[str, str]]:
+    """Build a lookahead alternation over every keyword plus a keyword -> bucket map."""
+    bucket_of = {keyword: bucket for bucket, keywords in buckets.items() for keyword in keywords}
+    # Longest first so a keyword that prefixes another does not hide it at the same position
+    keywords = sorted(bucket_of, key=len, reverse=True)
+    return re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))'), bucket_of
+
+
+def _unique_matches_by_group(pattern: re.Pattern, text: str) -> list[str]:
+    """Return distinct matches of *pattern* ordered by capturing group, then position.
+
+    Matches are deduplicated into one dict per group while scanning, so neither a
+    match list nor a sort is needed.
+    """
+    by_group = [{} for _ in range(pattern.groups)]
+    for m in pattern.finditer(text):
+        by_group[m.lastindex - 1][m.group()] = None
+    return list(dict.fromkeys(chain.from_iterable(by_group)))
+
+
+_RE_THEME_KEYWORDS, _THEME_OF_KEYWORD = _keyword_bucket_scanner(_THEME_KEYWORDS)
+_RE_HIGHLIGHT_KEYWORDS, _HIGHLIGHT_OF_KEYWORD = _keyword_bucket_scanner(_HIGHLIGHT_KEYWORDS)
+_RE_IMPACT_KEYWORDS, _IMPACT_OF_KEYWORD = _keyword_bucket_scanner(_IMPACT_KEYWORDS)
+_RE_NUMERIC_FACT = re.compile(r'\d+%|\d+倍|\d+[年月日]|\$\d+|¥\d+')
+
+# TOC truncation: per-codepoint word-character classes for the BMP, so the safe-break scan
+# is one table lookup per character (a shared bit means both sides belong to the same word)
+_TOC_DIGIT, _TOC_ASCII_ALNUM, _TOC_KATAKANA = 1, 2, 4
+_TOC_CHAR_KIND = bytearray(map(str.isdigit, map(chr, range(0x10000))))
+for _code in range(0x80):
+    if chr(_code).isalnum():
+        _TOC_CHAR_KIND[_code] |= _TOC_ASCII_ALNUM
+for _code in range(ord('ァ'), ord('ヶ') + 1):
+    _TOC_CHAR_KIND[_code] |= _TOC_KATAKANA
+del _code
+
+
+def _toc_char_kind(char: str) -> int:
+    """Return the _TOC_* class bits of *char* (digits only outside the BMP)."""
+    code = ord(char)
+    if code < 0x10000:
+        return _TOC_CHAR_KIND[code]
+    return _TOC_DIGIT if char.isdigit() else 0
+
+# Sentence endings accepted for lead paragraphs (str.endswith takes the tuple in one call)
+_LEAD_PROPER_ENDINGS = ('です。', 'ます。', 'ました。', 'ています。', 'でした。', 'ません。')
+_LEAD_LINE_ENDINGS = ('です。', 'ます。', 'ました。', 'ています。', 'でした。')
+_LEAD_DANGLING_ENDINGS = ('は', 'が', 'を', 'に', 'で', 'と', 'から')
+_LEAD_TERMINAL_PUNCT = ('。', '！', '？', '.', '!', '?')
+
+# Title endings: particles left dangling by truncation, and endings that already read complete
+_TRAILING_PARTICLES = ('は', 'が', 'を', 'に', 'へ', 'と')
+_TITLE_COMPLETE_ENDINGS = ('。', 'です', 'ます', 'た')
+
+# Static scaffolding of the lead text prompt; only the article context between them varies
+_LEAD_PROMPT_HEAD = """あなたはプロのニュースライターです。以下のAIニュース要約を基に、一般読者にも分かりやすい魅力的なニュースレターの導入文を生成してください。
+
+【本日の主要記事】
+"""
+_LEAD_PROMPT_TAIL = """
+
+【導入文の要件（一般読者向け簡潔版）】
+- 3つの段落で構成
+- 各段落は1文で、70-120文字（読みやすさ重視）
+- 第1段落: 最も注目すべきニュースを分かりやすく紹介
+- 第2段落: 他の重要な動きを日常生活への影響とともに説明
+- 第3段落: これらの変化が私たちの未来にもたらす変化を予測
+
+【厳格禁止事項】
+- 専門用語の多用: 「API」「アルゴリズム」「フレームワーク」
+- 抽象的表現: 「AI技術の進化」「業界の動向」「関連ニュース」
+- 曖昧表現: 「様々な」「多くの」「いくつかの」「複数の企業」
+- 冗長表現: 「〜について発表しました」「〜が明らかになりました」
+- 不完全文: 「〜が。」「〜は。」等の助詞終わり
+
+【必須要素（各段落に含める）】
+- 具体的企業名（OpenAI、Google、Meta等）
+- 身近な利用例（チャットボット、検索、翻訳等）
+- 日常生活への影響（仕事効率化、学習支援、創作支援等）
+
+【回答形式】
+以下の形式で3つの段落を生成してください：
+
+段落1: [第1文をここに記載]
+段落2: [第2文をここに記載]
+段落3: [第3文をここに記載]
+
+JSONではなく、上記の形式で日本語の文章を直接生成してください。"""
+
 # Remove text_processing import dependency that was causing HAS_LLM_ROUTER to fail
 # ensure_sentence_completeness is now defined as module-level function below
 
@@ -81,17 +511,30 @@ except ImportError:
 class NewsletterGenerator:
     """Generates Markdown newsletters from processed articles."""
 
-    def __init__(self, templates_dir: str = "src/templates"):
+    def __init__(self, templates_dir: str = "src/templates", llm_router: "LLMRouter | None" = None):
         """
         Initialize newsletter generator.
 
         Args:
             templates_dir: Directory containing Jinja2 templates
+            llm_router: Shared LLM router; reusing the caller's router keeps its
+                clients (and their pooled HTTP connections) warm across stages
         """
         self.templates_dir = Path(templates_dir)
         self.settings = get_settings()
-
-        if HAS_LLM_ROUTER:
+        self._title_short_length = self.settings.processing.title_short_length  # per-headline hot path
+        self.past_embedding_cache_dir = Path(self.settings.data_dir) / "context_cache"
+
+        # Persistent UPDATE/UNRELATED decisions keyed by SHA-256 of the compared content
+        self.update_decision_cache_path = Path(self.settings.data_dir) / "cache" / "update_decisions.json"
+        self._update_decision_cache: dict[str, dict[str, Any]] | None = None  # loaded lazily
+        self._update_decisions_inflight: dict[str, asyncio.Future] = {}
+        self.update_decision_cache_hits = 0
+        self.update_decision_cache_misses = 0
+
+        if llm_router is not None:
+            self.llm_router = llm_router
+        elif HAS_LLM_ROUTER:
             self.llm_router = LLMRouter()
         else:
             self.llm_router = None
@@ -111,8 +554,14 @@ class NewsletterGenerator:
             self.jinja_env = jinja2.Environment(
                 loader=jinja2.FileSystemLoader(str(self.templates_dir)),
                 autoescape=False,  # We want raw markdown
-                trim_blocks=False,
-                lstrip_blocks=False,
+                # Block tags consume their own line so the template emits no stray
+                # blank lines (the final blank-line collapse only acts as a guard)
+                trim_blocks=True,
+                lstrip_blocks=True,
+                # Compiled templates are cached in-process by name; skip the per-lookup
+                # mtime check and reuse compiled bytecode across runs (system temp dir)
+                auto_reload=False,
+                bytecode_cache=jinja2.FileSystemBytecodeCache(),
             )
             # Add custom filters
             self.jinja_env.filters['regex_replace'] = self._regex_replace_filter
@@ -170,65 +619,25 @@ class NewsletterGenerator:
         # Step 2: Consolidate multi-source articles (handles workflow clustering results)
         articles = await self._consolidate_multi_source_articles(articles)
 
-        filtered_articles = self._filter_articles_by_quality(articles, quality_threshold)
-
-        # Dynamic threshold adjustment if we don't have enough articles
-        original_threshold = quality_threshold
-        adjustment_attempts = 0
-        max_attempts = 3
-
-        while len(filtered_articles) < min_articles_target and adjustment_attempts < max_attempts:
-            # Gradually lower threshold to capture more articles
-            quality_threshold *= 0.9  # Reduce by 10% each iteration
-            adjustment_attempts += 1
-
-            if HAS_LOGGER:
-                logger.info(
-                    "Insufficient articles, adjusting quality threshold",
-                    current_count=len(filtered_articles),
-                    target_minimum=min_articles_target,
-                    old_threshold=original_threshold if adjustment_attempts == 1 else quality_threshold / 0.9,
-                    new_threshold=quality_threshold,
-                    attempt=adjustment_attempts
-                )
-
-            # Re-filter with new threshold
-            filtered_articles = self._filter_articles_by_quality(articles, quality_threshold)
-
-            # Break if we have enough articles or hit minimum viable threshold
-            if len(filtered_articles) >= min_articles_target or quality_threshold < 0.15:
-                break
-
-        # Apply deduplication with detailed logging
-        pre_dedup_count = len(filtered_articles)
-        filtered_articles = self._deduplicate_articles(filtered_articles)
-        post_dedup_count = len(filtered_articles)
+        # Score and rank every article once; duplicates are dropped from the ranked
+        # list so the threshold check below never needs another pass
+        ranked_articles = self._sorted_by_quality(articles)
+        pre_dedup_count = len(ranked_articles)
+        unique_articles = self._deduplicate_articles([art for _, art in ranked_articles])
+        unique_ids = {id(art) for art in unique_articles}
+        ranked_articles = [(score, art) for score, art in ranked_articles if id(art) in unique_ids]
 
         if HAS_LOGGER:
             logger.info(
                 "Article deduplication completed",
                 pre_dedup_count=pre_dedup_count,
-                post_dedup_count=post_dedup_count,
-                removed_duplicates=pre_dedup_count - post_dedup_count
+                post_dedup_count=len(ranked_articles),
+                removed_duplicates=pre_dedup_count - len(ranked_articles)
             )
 
-        # Final check - if still insufficient after deduplication, try one more relaxed filter
-        if len(filtered_articles) < min_articles_target and quality_threshold > 0.1:
-            if HAS_LOGGER:
-                logger.warning(
-                    "Still insufficient articles after deduplication, final threshold relaxation",
-                    post_dedup_count=len(filtered_articles),
-                    target_minimum=min_articles_target
-                )
-
-            # Emergency threshold for minimum viable newsletter
-            emergency_threshold = max(0.1, quality_threshold * 0.7)
-            emergency_filtered = self._filter_articles_by_quality(articles, emergency_threshold)
-            emergency_deduped = self._deduplicate_articles(emergency_filtered)
-
-            if len(emergency_deduped) > len(filtered_articles):
-                filtered_articles = emergency_deduped
-                quality_threshold = emergency_threshold
+        filtered_articles = self._select_articles_by_quality(
+            ranked_articles, quality_threshold, min_articles_target
+        )
 
         if HAS_LOGGER:
             logger.info(
@@ -243,14 +652,22 @@ class NewsletterGenerator:
         # Generate newsletter content
         newsletter_date = datetime.now()
 
+        # All LLM calls of this stage (enhanced summaries, titles, citation summaries)
+        # share one concurrency limit
+        llm_semaphore = asyncio.Semaphore(self.settings.processing.async_concurrency_limit)
+
+        async def limited(coro):
+            async with llm_semaphore:
+                return await coro
+
         # Generate Japanese titles for each article in parallel
         async def process_single_article(article):
+            raw_article = article.summarized_article.filtered_article.raw_article
+
             # PRD F-15 COMPLIANCE: Generate citation-based summary if citations exist
             if (hasattr(article, 'citations') and article.citations and
                 len(article.citations) > 0 and self.llm_router):
 
-                raw_article = article.summarized_article.filtered_article.raw_article
-
                 # Prepare citations for LLM
                 citation_dicts = []
                 for citation in article.citations[:3]:  # Max 3 citations per PRD F-15
@@ -270,13 +687,13 @@ class NewsletterGenerator:
 
                 try:
                     # Generate new citation-based summary
-                    enhanced_summary = await self.llm_router.generate_citation_based_summary(
+                    enhanced_summary = await limited(self.llm_router.generate_citation_based_summary(
                         article_title=raw_article.title,
                         article_content=raw_article.content,
                         article_url=str(raw_article.url),
                         source_name=raw_article.source_id,
                         citations=citation_dicts
-                    )
+                    ))
 
                     # Replace the existing summary with enhanced version
                     article.summarized_article.summary = enhanced_summary
@@ -298,25 +715,25 @@ class NewsletterGenerator:
             # 🔥 ULTRA THINK FIX: 統合タイトル生成で【続報】+🆙重複を根本解決
             # Check UPDATE status BEFORE title generation to pass context
             has_update_flag = hasattr(article, 'is_update') and article.is_update
-            raw_title_has_emoji = '🆙' in article.summarized_article.filtered_article.raw_article.title
+            raw_title_has_emoji = '🆙' in raw_article.title
             is_update_article = has_update_flag or raw_title_has_emoji
 
             # Pass update context to title generation for integrated processing
-            article.japanese_title = await self._generate_article_title_integrated(
+            article.japanese_title = await limited(self._generate_article_title_integrated(
                 article, is_update=is_update_article
-            )
+            ))
 
             # Fallback for failed title generation to prevent article loss
             if not article.japanese_title:
-                raw_title = article.summarized_article.filtered_article.raw_article.title
+                raw_title = raw_article.title
                 logger.warning(
                     "Integrated title generation failed, using fallback",
-                    article_id=article.summarized_article.filtered_article.raw_article.id
+                    article_id=raw_article.id
                 )
                 # Apply integrated fallback logic
                 if is_update_article:
                     # Remove redundant 【続報】 and add 🆙 if needed
-                    clean_title = re.sub(r'【?続報】?[:：]?\s*', '', raw_title)
+                    clean_title = _RE_SEQUEL_PREFIX.sub('', raw_title)
                     article.japanese_title = f"{clean_title}🆙" if '🆙' not in clean_title else clean_title
                 else:
                     article.japanese_title = raw_title
@@ -325,52 +742,45 @@ class NewsletterGenerator:
             if is_update_article:
                 logger.info(
                     "Integrated UPDATE title generation completed",
-                    article_id=article.summarized_article.filtered_article.raw_article.id,
+                    article_id=raw_article.id,
                     final_title=article.japanese_title,
                     has_update_flag=has_update_flag,
                     raw_title_has_emoji=raw_title_has_emoji
                 )
 
-            # Normalize terminology in Japanese title
-            if article.japanese_title:
-                # Clean any remaining hash marks (safety measure for double hash issue)
-                article.japanese_title = re.sub(r'^[#\s]*["\'「]|["\'」]+$', '', article.japanese_title).strip()
-                article.japanese_title = re.sub(r'^#+\s*', '', article.japanese_title)
-                article.japanese_title = self._normalize_terminology(article.japanese_title)
-            if (article.summarized_article and
-                article.summarized_article.summary and
-                article.summarized_article.summary.summary_points):
-                article.summarized_article.summary.summary_points = self._cleanup_summary_points(
-                    article.summarized_article.summary.summary_points
-                )
-                # Apply terminology normalization and quality checks to each summary point
-                normalized_points = []
-                for point in article.summarized_article.summary.summary_points:
-                    # First normalize terminology
-                    normalized_point = self._normalize_terminology(point)
-                    # Then apply quality checks for natural Japanese
-                    quality_checked_point = self._improve_japanese_quality(normalized_point)
-                    normalized_points.append(quality_checked_point)
-                article.summarized_article.summary.summary_points = normalized_points
-                # Note: Removed _shorten_summary_points to preserve bullet content integrity per Lawrence's feedback
+            # CPU-bound text normalization runs in a worker thread so other articles'
+            # LLM calls keep progressing on the event loop
+            await asyncio.to_thread(self._normalize_article_fields, article)
             return article
 
-        # Process all articles in parallel for title generation and cleanup
-        tasks = [process_single_article(article) for article in filtered_articles]
-        filtered_articles = await asyncio.gather(*tasks)
-
-        # New Step: Generate Japanese summaries for all secondary citations in parallel
-        citation_generator = CitationGenerator(self.llm_router)
+        # Generate Japanese summaries for all secondary citations in the same wave
+        # (skipped when CitationGenerator could not be imported)
         all_citations_to_summarize = []
-        for article in filtered_articles:
-            if article.citations:
-                all_citations_to_summarize.extend(article.citations)
+        if self.citation_generator:
+            for article in filtered_articles:
+                if article.citations:
+                    all_citations_to_summarize.extend(article.citations)
 
         if all_citations_to_summarize:
             logger.info(f"Generating Japanese summaries for {len(all_citations_to_summarize)} secondary citations...")
-            await citation_generator.generate_summaries_for_citations(all_citations_to_summarize)
+
+        # Process all articles and citations in one parallel wave. Article tasks are scheduled
+        # first so each reads its citations before any citation summary is overwritten.
+        article_tasks = [process_single_article(article) for article in filtered_articles]
+        citation_tasks = [
+            limited(self.citation_generator.generate_summary_for_citation(citation))
+            for citation in all_citations_to_summarize
+        ]
+        results = await asyncio.gather(*article_tasks, *citation_tasks)
+        filtered_articles = results[:len(article_tasks)]
+
+        if all_citations_to_summarize:
             logger.info("Finished generating summaries for secondary citations.")
 
+        # Generate lead text after all articles are processed: it is built from the
+        # generated Japanese titles and summary points, so it cannot overlap that wave
+        lead_text = await self._generate_lead_text(filtered_articles, edition)
+
         # Prepare template context
         context = {
             "date": newsletter_date,
@@ -403,7 +813,6 @@ class NewsletterGenerator:
                     if HAS_LOGGER:
                         logger.warning("Default template also not found, using basic markdown")
                     template = None
-                    newsletter_content = self._generate_basic_markdown(context)
         else:
             template_name = "basic"
             template = None
@@ -411,15 +820,18 @@ class NewsletterGenerator:
         # Debug: Log UPDATE articles status before template rendering
         update_articles = [a for a in filtered_articles if getattr(a, 'is_update', False)]
         if update_articles:
-            logger.info(
-                f"Rendering template with {len(update_articles)} UPDATE articles",
-                update_articles=[{
-                    'id': a.summarized_article.filtered_article.raw_article.id,
-                    'is_update': getattr(a, 'is_update', False),
-                    'japanese_title': getattr(a, 'japanese_title', None),
-                    'has_emoji': '🆙' in getattr(a, 'japanese_title', '') if getattr(a, 'japanese_title', None) else False
-                } for a in update_articles]
-            )
+            logger.info(f"Rendering template with {len(update_articles)} UPDATE articles")
+            # Per-article details are only built when DEBUG records are actually emitted
+            if _is_debug_enabled():
+                logger.debug(
+                    "UPDATE articles before template rendering",
+                    update_articles=[{
+                        'id': a.summarized_article.filtered_article.raw_article.id,
+                        'is_update': getattr(a, 'is_update', False),
+                        'japanese_title': getattr(a, 'japanese_title', None),
+                        'has_emoji': '🆙' in getattr(a, 'japanese_title', '') if getattr(a, 'japanese_title', None) else False
+                    } for a in update_articles]
+                )
 
         # Render template (if available)
         if template:
@@ -441,10 +853,8 @@ class NewsletterGenerator:
             # Fallback: Generate basic markdown without template
             newsletter_content = self._generate_basic_markdown(context)
 
-        # Collapse excessive blank lines (3+ -> 2)
-        newsletter_content = re.sub(r"\n{3,}", "\n\n", newsletter_content)
-
-        # Perform final quality validation on generated newsletter
+        # Perform final quality validation on generated newsletter (this also collapses
+        # excessive blank lines left by the basic markdown fallback)
         newsletter_content = self._validate_and_fix_newsletter_content(newsletter_content, filtered_articles)
 
         # Comprehensive quality check
@@ -511,10 +921,9 @@ class NewsletterGenerator:
 
         # 🔥 ULTRA THINK: Final failsafe削除 - 統合タイトル生成で処理済み
         # 重複による「🆙🆙」問題を根本解決
-        update_count_check = 0
-        for article in filtered_articles:
-            if hasattr(article, 'is_update') and article.is_update:
-                update_count_check += 1
+        update_count_check = len(update_articles)
+        if _is_debug_enabled():
+            for article in update_articles:
                 # 統合タイトル生成で🆙が正しく付与されているかチェックのみ
                 japanese_title = getattr(article, 'japanese_title', None)
                 has_emoji = japanese_title and '🆙' in japanese_title
@@ -527,9 +936,6 @@ class NewsletterGenerator:
 
         logger.info(f"F-16 UPDATE article verification: {update_count_check} articles processed with integrated title generation")
 
-        # Generate lead text after all articles are processed
-        lead_text = await self._generate_lead_text(filtered_articles, edition)
-
         # Create newsletter output
         newsletter_output = NewsletterOutput(
             title=f"{newsletter_date.strftime('%Y年%m月%d日')} AI NEWS TLDR",
@@ -562,6 +968,32 @@ class NewsletterGenerator:
 
         return newsletter_output
 
+    def _normalize_article_fields(self, article: ProcessedArticle) -> None:
+        """Normalize the Japanese title and summary points of *article* in place."""
+
+        # Normalize terminology in Japanese title
+        if article.japanese_title:
+            # Clean any remaining hash marks (safety measure for double hash issue)
+            article.japanese_title = _RE_TITLE_QUOTES.sub('', article.japanese_title).strip()
+            article.japanese_title = _RE_TITLE_HASH.sub('', article.japanese_title)
+            article.japanese_title = self._normalize_terminology(article.japanese_title)
+        if (article.summarized_article and
+            article.summarized_article.summary and
+            article.summarized_article.summary.summary_points):
+            article.summarized_article.summary.summary_points = self._cleanup_summary_points(
+                article.summarized_article.summary.summary_points
+            )
+            # Apply terminology normalization and quality checks to each summary point
+            normalized_points = []
+            for point in article.summarized_article.summary.summary_points:
+                # First normalize terminology
+                normalized_point = self._normalize_terminology(point)
+                # Then apply quality checks for natural Japanese
+                quality_checked_point = self._improve_japanese_quality(normalized_point)
+                normalized_points.append(quality_checked_point)
+            article.summarized_article.summary.summary_points = normalized_points
+            # Note: Removed _shorten_summary_points to preserve bullet content integrity per Lawrence's feedback
+
     async def _apply_context_analysis(self, articles: list[ProcessedArticle]) -> list[ProcessedArticle]:
         """
         [FIXED] Apply context analysis based on PRD F-16.
@@ -587,13 +1019,15 @@ class NewsletterGenerator:
 
             # Ensure required imports are available
             import numpy as np
-            from sklearn.metrics.pairwise import cosine_similarity
 
             from src.utils.embedding_manager import EmbeddingManager
             from src.utils.supabase_client import get_recent_contextual_articles
 
-            # Get recent articles from Supabase
-            past_articles = await get_recent_contextual_articles(days_back=7, limit=1000)
+            # Get recent articles from Supabase (metadata only; embeddings come from the cache
+            # when the set of past articles is unchanged since the last run)
+            past_articles = await get_recent_contextual_articles(
+                days_back=7, limit=1000, include_embedding=False
+            )
 
             if not past_articles:
                 logger.info("No past articles found for context analysis.")
@@ -602,101 +1036,176 @@ class NewsletterGenerator:
             # Initialize embedding manager
             embedding_manager = EmbeddingManager()
 
-            # Prepare past articles for similarity comparison
-            past_embeddings = []
-            past_article_map = {}
-
-            for article_data in past_articles:
-                if article_data.get('embedding'):
-                    article_id = article_data['article_id']
-                    embedding = article_data['embedding']
+            cache_key = self._past_embedding_cache_key(past_articles)
+            cached = self._load_past_embedding_cache(cache_key)
+            if cached is not None:
+                past_embedding_matrix, past_positions = cached
+                logger.info(f"Reusing cached past-embedding matrix for {len(past_positions)} articles")
+            else:
+                past_articles = await get_recent_contextual_articles(days_back=7, limit=1000)
+                if not past_articles:
+                    logger.info("No past articles found for context analysis.")
+                    return articles
+
+                # Prepare past articles for similarity comparison: decode every stored embedding
+                # first, then build and normalize one (Np, D) matrix in a single vectorized step
+                past_rows = []
+                past_positions = []
+
+                for position, article_data in enumerate(past_articles):
+                    embedding = article_data.get('embedding')
+                    if not embedding:
+                        continue
 
-                    # Convert embedding to numpy array if it's a string
+                    # Supabase may return the vector column as a JSON string
                     if isinstance(embedding, str):
                         try:
-                            import json
-                            embedding = json.loads(embedding)
-                        except:
-                            try:
-                                embedding = eval(embedding)
-                            except:
-                                logger.warning(f"Failed to parse embedding for article {article_id}")
-                                continue
-
-                    try:
-                        embedding_array = np.array(embedding, dtype=np.float32)
-                        # Normalize for cosine similarity
-                        embedding_array = embedding_array / np.linalg.norm(embedding_array)
-                        past_embeddings.append(embedding_array)
-                        past_article_map[article_id] = article_data
-                    except Exception as e:
-                        logger.warning(f"Failed to process embedding for article {article_id}: {e}")
-                        continue
-
-            if not past_embeddings:
-                logger.info("No valid embeddings found in past articles for context analysis.")
-                return articles
+                            embedding = orjson.loads(embedding) if HAS_ORJSON else json.loads(embedding)
+                        except ValueError:
+                            logger.warning(f"Failed to parse embedding for article {article_data.get('article_id')}")
+                            continue
+
+                    past_rows.append(embedding)
+                    past_positions.append(position)
+
+                if not past_rows:
+                    logger.info("No valid embeddings found in past articles for context analysis.")
+                    return articles
+
+                # Drop rows whose dimension does not match the first embedding
+                dimension = len(past_rows[0])
+                keep = [i for i, row in enumerate(past_rows) if len(row) == dimension]
+                if len(keep) < len(past_rows):
+                    logger.warning(f"Skipping {len(past_rows) - len(keep)} past embeddings with unexpected dimension")
+                    past_rows = [past_rows[i] for i in keep]
+                    past_positions = [past_positions[i] for i in keep]
+
+                # Create a normalized matrix of past embeddings for efficient search
+                past_embedding_matrix = np.asarray(past_rows, dtype=np.float32)
+                past_embedding_matrix /= np.linalg.norm(past_embedding_matrix, axis=1, keepdims=True)
+
+                # The cache stores float16; round through it here too so cache hits and
+                # misses score identically
+                past_embedding_matrix = past_embedding_matrix.astype(np.float16)
+                self._save_past_embedding_cache(
+                    self._past_embedding_cache_key(past_articles), past_embedding_matrix, past_positions
+                )
+                past_embedding_matrix = past_embedding_matrix.astype(np.float32)
 
-            # Create a matrix of past embeddings for efficient search
-            past_embedding_matrix = np.array(past_embeddings)
-            past_article_ids = list(past_article_map.keys())
+            past_article_rows = [past_articles[i] for i in past_positions]
 
-            # Process each current article (only those without workflow analysis)
-            updates_found = 0
+            # Embed all current articles (only those without workflow analysis) in one request
+            texts = []
+            text_articles = []
             for article in articles:
                 # Skip if workflow already analyzed this article
                 if hasattr(article, 'context_analysis') and article.context_analysis is not None:
                     continue
 
                 try:
-                    current_text = f"{article.summarized_article.filtered_article.raw_article.title} {' '.join(article.summarized_article.summary.summary_points)}"
-                    current_embedding = await embedding_manager.get_embedding(current_text)
+                    texts.append(f"{article.summarized_article.filtered_article.raw_article.title} {' '.join(article.summarized_article.summary.summary_points)}")
+                    text_articles.append(article)
+                except Exception as e:
+                    logger.warning(f"Failed to analyze context for article: {e}")
+                    continue
 
-                    if current_embedding is None:
-                        continue
+            embeddings = await embedding_manager.generate_embeddings_batch(texts)
 
-                    # Normalize current embedding
-                    current_embedding = current_embedding / np.linalg.norm(current_embedding)
+            pending_articles = []
+            pending_texts = []
+            current_embeddings = []
+            for article, text, current_embedding in zip(text_articles, texts, embeddings):
+                if current_embedding is None:
+                    continue
+
+                pending_articles.append(article)
+                pending_texts.append(text)
+                current_embeddings.append(current_embedding)
 
-                    # Find similar past articles
-                    similarities = cosine_similarity(current_embedding.reshape(1, -1), past_embedding_matrix)[0]
+            if not pending_articles:
+                return articles
 
-                    # Get top 3 most similar articles
-                    top_indices = np.argsort(similarities)[-3:][::-1]
+            # Cosine similarity of every current article against every past article in one
+            # matmul, run in a worker thread (BLAS releases the GIL) so LLM calls keep flowing
+            similarity_matrix = await asyncio.to_thread(
+                self._cosine_similarity_matrix, current_embeddings, past_embedding_matrix
+            )
 
-                    for i in top_indices:
-                        similarity_score = similarities[i]
+            top_k = min(3, past_embedding_matrix.shape[0])
+            sequel_threshold = 0.95  # Very high threshold - only near-identical content
+
+            # Only articles with at least one near-identical past article can be sequels
+            candidate_rows = np.flatnonzero(similarity_matrix.max(axis=1) > sequel_threshold)
+            skipped_count = len(pending_articles) - len(candidate_rows)
+            if skipped_count:
+                logger.info(f"Skipped {skipped_count}/{len(pending_articles)} articles with no past article above {sequel_threshold} similarity")
+
+            # Top 3 most similar past articles of every candidate row in one vectorized step
+            top_indices, top_scores = self._top_k_similarities(similarity_matrix[candidate_rows], top_k)
+
+            # Materialize every (current, past) pair above the threshold, best score first
+            # within each article, and confirm all of them in one bounded fan-out
+            pair_rows = []
+            pairs = []
+            past_trigrams = {}  # past row index -> trigram set, shared across current articles
+            lexical_skipped = 0
+            for row, indices, scores in zip(candidate_rows, top_indices, top_scores):
+                article = pending_articles[row]
+                current_trigrams = self._char_trigrams(pending_texts[row])
+                try:
+                    for i, similarity_score in zip(indices, scores):
                         # Very high threshold to reduce false positives
-                        if similarity_score > 0.95: # Very high threshold - only near-identical content
-                            past_article_id = past_article_ids[i]
-                            past_article_data = past_article_map[past_article_id]
+                        if similarity_score <= sequel_threshold:
+                            continue
+
+                        past_article_data = past_article_rows[i]
 
-                            logger.info(
-                                f"Found potential sequel for '{article.summarized_article.filtered_article.raw_article.title[:50]}...' "
-                                f"(score: {similarity_score:.2f}) with '{past_article_data['title'][:50]}...'"
+                        # Cheap lexical prefilter: pairs with little surface overlap are
+                        # answered UNRELATED without an LLM round trip
+                        if i not in past_trigrams:
+                            past_trigrams[i] = self._char_trigrams(
+                                f"{past_article_data.get('title', '')} {past_article_data.get('content_summary', '')}"
                             )
+                        if not self._lexically_related(current_trigrams, past_trigrams[i]):
+                            lexical_skipped += 1
+                            continue
 
-                            # Use LLM to confirm if it's an update with stricter criteria
-                            decision = await self._confirm_update_with_llm(article, past_article_data)
+                        logger.info(
+                            f"Found potential sequel for '{article.summarized_article.filtered_article.raw_article.title[:50]}...' "
+                            f"(score: {similarity_score:.2f}) with '{past_article_data['title'][:50]}...'"
+                        )
+                        pair_rows.append(row)
+                        pairs.append((article, past_article_data))
+                except Exception as e:
+                    logger.warning(f"Failed to analyze context for article: {e}")
 
-                            if decision == "UPDATE":
-                                article.is_update = True
-                                article.previous_article_url = past_article_data.get('source_url', '')
-                                updates_found += 1
+            if lexical_skipped:
+                logger.info(f"Lexical prefilter skipped {lexical_skipped} pairs below {_UPDATE_LEXICAL_THRESHOLD} trigram overlap")
 
-                                # 🔥 ULTRA THINK: 🆙絵文字は統合タイトル生成で処理済み
-                                # raw_titleへの追加は削除（重複防止）
-                                logger.info(
-                                    "Confirmed fallback UPDATE - emoji handled in integrated title generation",
-                                    article_id=article.summarized_article.filtered_article.raw_article.id
-                                )
+            decisions = await self._confirm_updates_with_llm_batch(pairs)
 
-                                logger.info(f"Confirmed fallback UPDATE for article {article.summarized_article.filtered_article.raw_article.id}")
-                                # Once confirmed, no need to check other past articles
-                                break
-                except Exception as e:
-                    logger.warning(f"Failed to analyze context for article: {e}")
-                    continue
+            # Pairs are in score order per article, so the first UPDATE is the most similar one
+            confirmed_by_row = {}
+            for row, (_, past_article_data), decision in zip(pair_rows, pairs, decisions):
+                if decision == "UPDATE" and row not in confirmed_by_row:
+                    confirmed_by_row[row] = past_article_data
+
+            updates_found = 0
+            for row, past_article_data in confirmed_by_row.items():
+                article = pending_articles[row]
+                article.is_update = True
+                article.previous_article_url = past_article_data.get('source_url', '')
+                updates_found += 1
+                article_id = article.summarized_article.filtered_article.raw_article.id
+
+                # 🔥 ULTRA THINK: 🆙絵文字は統合タイトル生成で処理済み
+                # raw_titleへの追加は削除（重複防止）
+                logger.info(
+                    "Confirmed fallback UPDATE - emoji handled in integrated title generation",
+                    article_id=article_id
+                )
+
+                logger.info(f"Confirmed fallback UPDATE for article {article_id}")
 
             if updates_found > 0:
                 logger.info(f"Fallback context analysis completed: found {updates_found} update articles")
@@ -707,6 +1216,166 @@ class NewsletterGenerator:
             logger.error(f"Context analysis failed: {e}", exc_info=True)
             return articles # Return original articles on failure
 
+    @staticmethod
+    def _cosine_similarity_matrix(current_embeddings: list, past_embedding_matrix) -> Any:
+        """Return the (Nc, Np) cosine similarities against a row-normalized past matrix."""
+        import numpy as np
+
+        current_matrix = np.vstack(current_embeddings).astype(np.float32)
+        current_matrix /= np.linalg.norm(current_matrix, axis=1, keepdims=True)
+        return current_matrix @ past_embedding_matrix.T
+
+    @staticmethod
+    def _top_k_similarities(similarities, k: int) -> tuple[Any, Any]:
+        """Return the top-*k* column indices and scores of each row, best first.
+
+        All rows are partitioned and sorted with single NumPy calls, so the
+        cost does not grow with Python-level work per row.
+        """
+        import numpy as np
+
+        candidates = np.argpartition(similarities, -k, axis=1)[:, -k:]
+        candidate_scores = np.take_along_axis(similarities, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1)
+        return (
+            np.take_along_axis(candidates, order, axis=1),
+            np.take_along_axis(candidate_scores, order, axis=1),
+        )
+
+    @staticmethod
+    def _char_trigrams(text: str) -> set[str]:
+        """Return the set of character trigrams of *text* (whitespace-insensitive, lowercased)."""
+        text = "".join(text.lower().split())
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    @staticmethod
+    def _jaccard(a: set[str], b: set[str]) -> float:
+        """Return the Jaccard similarity of two sets (0.0 when both are empty)."""
+        if not a or not b:
+            return 0.0
+        return len(a & b) / len(a | b)
+
+    @classmethod
+    def _lexically_related(cls, current_trigrams: set[str], past_trigrams: set[str]) -> bool:
+        """Return True if a candidate pair overlaps enough to be worth an LLM confirmation."""
+        return cls._jaccard(current_trigrams, past_trigrams) >= _UPDATE_LEXICAL_THRESHOLD
+
+    def _past_embedding_cache_key(self, past_articles: list[dict]) -> str:
+        """Key the past-embedding cache on the ordered row ids of the fetched window."""
+        ids = "\n".join(str(row.get('id', row.get('article_id', ''))) for row in past_articles)
+        return hashlib.sha256(ids.encode('utf-8')).hexdigest()[:32]
+
+    def _load_past_embedding_cache(self, cache_key: str) -> tuple[Any, list[int]] | None:
+        """
+        Load a cached normalized past-embedding matrix.
+
+        The matrix is stored as float16 (half the bytes to read) and upcast to
+        float32 here, since NumPy has no BLAS-backed float16 matmul.
+
+        Returns:
+            (float32 matrix, row positions in the fetched article list) or None on miss
+        """
+        import numpy as np
+
+        matrix_path = self.past_embedding_cache_dir / f"{cache_key}.npy"
+        positions_path = self.past_embedding_cache_dir / f"{cache_key}.json"
+        if not (matrix_path.exists() and positions_path.exists()):
+            return None
+
+        try:
+            matrix = np.load(matrix_path, mmap_mode='r')
+            positions = json.loads(positions_path.read_text(encoding='utf-8'))
+            if matrix.shape[0] != len(positions):
+                return None
+            return matrix.astype(np.float32), positions
+        except Exception as e:
+            logger.warning(f"Failed to load past-embedding cache: {e}")
+            return None
+
+    def _save_past_embedding_cache(self, cache_key: str, matrix: Any, positions: list[int]) -> None:
+        """Persist the normalized past-embedding matrix as float16, replacing any older cache entry."""
+        import numpy as np
+
+        try:
+            self.past_embedding_cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in chain(
+                self.past_embedding_cache_dir.glob("*.npy"),
+                self.past_embedding_cache_dir.glob("*.json"),
+            ):
+                if stale.stem != cache_key:
+                    stale.unlink(missing_ok=True)
+
+            # Both files are written via temp + rename; the loader needs both and checks
+            # that their lengths agree, so a crash between the two writes is a cache miss
+            buf = io.BytesIO()
+            np.save(buf, matrix.astype(np.float16, copy=False))
+            _write_bytes_atomic(self.past_embedding_cache_dir / f"{cache_key}.npy", buf.getvalue())
+            _write_bytes_atomic(
+                self.past_embedding_cache_dir / f"{cache_key}.json", json.dumps(positions).encode('utf-8')
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save past-embedding cache: {e}")
+
+    async def _confirm_updates_with_llm_batch(
+        self,
+        pairs: list[tuple[ProcessedArticle, dict]]
+    ) -> list[str]:
+        """
+        Confirm several (current article, past article) pairs concurrently.
+
+        Requests fan out through ``asyncio.gather`` bounded by the configured
+        async concurrency limit, so their round-trips overlap.
+
+        Returns:
+            "UPDATE" or "UNRELATED" for each pair, in input order
+        """
+        if not pairs:
+            return []
+
+        semaphore = asyncio.Semaphore(self.settings.processing.async_concurrency_limit)
+
+        async def confirm(current_article, past_article):
+            async with semaphore:
+                return await self._confirm_update_with_llm(current_article, past_article)
+
+        decisions = await asyncio.gather(*[confirm(current, past) for current, past in pairs])
+        self._save_update_decision_cache()
+        logger.info(
+            f"Update decision cache: {self.update_decision_cache_hits} hits, "
+            f"{self.update_decision_cache_misses} misses"
+        )
+        return decisions
+
+    def _load_update_decision_cache(self) -> dict[str, dict[str, Any]]:
+        """Return the persistent decision cache, loading it and dropping expired entries on first use."""
+        if self._update_decision_cache is None:
+            entries = {}
+            try:
+                if self.update_decision_cache_path.exists():
+                    entries = json.loads(self.update_decision_cache_path.read_text(encoding='utf-8'))
+            except Exception as e:
+                logger.warning(f"Failed to load update decision cache: {e}")
+
+            cutoff = datetime.now().timestamp() - _UPDATE_DECISION_TTL_SECONDS
+            self._update_decision_cache = {
+                key: entry for key, entry in entries.items()
+                if entry.get('timestamp', 0) >= cutoff
+            }
+        return self._update_decision_cache
+
+    def _save_update_decision_cache(self) -> None:
+        """Persist the decision cache if it has been loaded."""
+        if self._update_decision_cache is None:
+            return
+        try:
+            self.update_decision_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_bytes_atomic(
+                self.update_decision_cache_path,
+                json.dumps(self._update_decision_cache, ensure_ascii=False).encode('utf-8'),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save update decision cache: {e}")
+
     async def _confirm_update_with_llm(self, current_article: ProcessedArticle, past_article: dict) -> str:
         """
         Use LLM to confirm if the current article is an update to the past one.
@@ -743,7 +1412,30 @@ class NewsletterGenerator:
             Respond with only one word: "UPDATE" or "UNRELATED".
             """
 
-            if HAS_LLM_ROUTER and self.llm_router:
+            if not (HAS_LLM_ROUTER and self.llm_router):
+                return "UNRELATED" # Default to unrelated if LLM fails - be conservative
+
+            # Same pair compared before (this run or an earlier one): reuse the decision
+            cache_key = hashlib.sha256(
+                f"{current_title}\0{current_summary}\0{past_title}\0{past_summary}".encode('utf-8')
+            ).hexdigest()
+            cache = self._load_update_decision_cache()
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.update_decision_cache_hits += 1
+                return cached['decision']
+
+            # Identical pair already being confirmed by a concurrent task: share its result
+            inflight = self._update_decisions_inflight.get(cache_key)
+            if inflight is not None:
+                self.update_decision_cache_hits += 1
+                return await asyncio.shield(inflight)
+
+            self.update_decision_cache_misses += 1
+            future = asyncio.get_running_loop().create_future()
+            self._update_decisions_inflight[cache_key] = future
+            decision = "UNRELATED"
+            try:
                 response = await self.llm_router.generate_simple_text(
                     prompt=prompt,
                     max_tokens=5,
@@ -752,11 +1444,14 @@ class NewsletterGenerator:
 
                 decision = response.strip().upper()
                 if decision in ["UPDATE", "UNRELATED"]:
-                    return decision
-                # If LLM returns something else, be conservative
-                return "UNRELATED"
-
-            return "UNRELATED" # Default to unrelated if LLM fails - be conservative
+                    cache[cache_key] = {'decision': decision, 'timestamp': datetime.now().timestamp()}
+                else:
+                    # If LLM returns something else, be conservative
+                    decision = "UNRELATED"
+                return decision
+            finally:
+                future.set_result(decision)
+                del self._update_decisions_inflight[cache_key]
 
         except Exception as e:
             logger.warning(f"LLM update confirmation failed: {e}")
@@ -848,11 +1543,44 @@ class NewsletterGenerator:
     async def _generate_llm_lead_text(
         self,
         articles: list[ProcessedArticle],
-        edition: str
+        edition: str,
+        prompt: str | None = None
     ) -> dict[str, Any]:
-        """Generate high-quality lead text using LLM based on article content."""
+        """Generate high-quality lead text using LLM based on article content.
+
+        *prompt* may be passed in when it was already built by
+        ``_build_lead_text_prompt`` (e.g. shared by retry attempts).
+        """
+
+        if prompt is None:
+            prompt = self._build_lead_text_prompt(articles, edition)
+        if not prompt:
+            return None
+
+        # Generate lead text using LLM
+        try:
+            lead_text_response = await self.llm_router.generate_simple_text(
+                prompt=prompt,
+                max_tokens=700,  # Increased from 500 to 700 to prevent truncation
+                temperature=0.2,  # Low temperature for consistency
+            )
+        except Exception as e:
+            logger.warning(f"LLM call failed in lead text generation: {e}")
+            return None
+
+        if not lead_text_response:
+            return None
+
+        # Parse LLM response into title and paragraphs
+        return self._parse_llm_lead_text_response(lead_text_response)
+
+    def _build_lead_text_prompt(
+        self,
+        articles: list[ProcessedArticle],
+        edition: str
+    ) -> str | None:
+        """Build the LLM lead text prompt from the articles, or None if no article has a summary."""
 
-        # Prepare structured input for LLM
         article_summaries = []
 
         for i, article in enumerate(articles[:10]):  # Use up to 10 articles for context
@@ -882,24 +1610,7 @@ class NewsletterGenerator:
             return None
 
         # Create structured prompt for LLM
-        prompt = self._create_lead_text_prompt(article_summaries, edition)
-
-        # Generate lead text using LLM
-        try:
-            lead_text_response = await self.llm_router.generate_simple_text(
-                prompt=prompt,
-                max_tokens=700,  # Increased from 500 to 700 to prevent truncation
-                temperature=0.2,  # Low temperature for consistency
-            )
-        except Exception as e:
-            logger.warning(f"LLM call failed in lead text generation: {e}")
-            return None
-
-        if not lead_text_response:
-            return None
-
-        # Parse LLM response into title and paragraphs
-        return self._parse_llm_lead_text_response(lead_text_response)
+        return self._create_lead_text_prompt(article_summaries, edition)
 
     def _create_lead_text_prompt(
         self,
@@ -922,41 +1633,7 @@ class NewsletterGenerator:
             context_lines.append("")
 
         context = "\n".join(context_lines)
-
-        prompt = f"""あなたはプロのニュースライターです。以下のAIニュース要約を基に、一般読者にも分かりやすい魅力的なニュースレターの導入文を生成してください。
-
-【本日の主要記事】
-{context}
-
-【導入文の要件（一般読者向け簡潔版）】
-- 3つの段落で構成
-- 各段落は1文で、70-120文字（読みやすさ重視）
-- 第1段落: 最も注目すべきニュースを分かりやすく紹介
-- 第2段落: 他の重要な動きを日常生活への影響とともに説明
-- 第3段落: これらの変化が私たちの未来にもたらす変化を予測
-
-【厳格禁止事項】
-- 専門用語の多用: 「API」「アルゴリズム」「フレームワーク」
-- 抽象的表現: 「AI技術の進化」「業界の動向」「関連ニュース」
-- 曖昧表現: 「様々な」「多くの」「いくつかの」「複数の企業」
-- 冗長表現: 「〜について発表しました」「〜が明らかになりました」
-- 不完全文: 「〜が。」「〜は。」等の助詞終わり
-
-【必須要素（各段落に含める）】
-- 具体的企業名（OpenAI、Google、Meta等）
-- 身近な利用例（チャットボット、検索、翻訳等）
-- 日常生活への影響（仕事効率化、学習支援、創作支援等）
-
-【回答形式】
-以下の形式で3つの段落を生成してください：
-
-段落1: [第1文をここに記載]
-段落2: [第2文をここに記載]
-段落3: [第3文をここに記載]
-
-JSONではなく、上記の形式で日本語の文章を直接生成してください。"""
-
-        return prompt
+        return f"{_LEAD_PROMPT_HEAD}{context}{_LEAD_PROMPT_TAIL}"
 
     def _validate_lead_paragraph(self, paragraph: str) -> tuple[bool, str]:
         """リード文の文法検証"""
@@ -967,19 +1644,16 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         paragraph = paragraph.strip()
 
         # 不完全な文のパターン
-        incomplete_patterns = [
-            (r'^[^。！？]*[がはをにで]。', "助詞の後に句点"),
-            (r'[A-Za-z\u30A0-\u30FF\u3040-\u309F\u4E00-\u9FAF]+が。', "主語の後すぐに句点"),
-            (r'[はがをに]$', "助詞で終わる文"),
-            (r'[がはをにで]。\s*[^。！？]*$', "文中に不完全な句点")
-        ]
-
-        for pattern, reason in incomplete_patterns:
-            if re.search(pattern, paragraph):
-                return False, f"不完全な文: {reason}"
+        match = _RE_LEAD_INCOMPLETE.search(paragraph)
+        if match and match.lastgroup != 'trailing_period':
+            return False, f"不完全な文: {_LEAD_INCOMPLETE_REASONS[match.lastgroup]}"
+        if paragraph[-1] in _LEAD_ENDING_PARTICLES:
+            return False, "不完全な文: 助詞で終わる文"
+        if match:
+            return False, f"不完全な文: {_LEAD_INCOMPLETE_REASONS[match.lastgroup]}"
 
         # 重複表現のチェック
-        if re.search(r'(されています|しています).*?(と発表|と報告|と説明)', paragraph):
+        if _RE_LEAD_REDUNDANT.search(paragraph):
             return False, "重複表現（〜していますと発表）"
 
         # 文の長さチェック
@@ -987,76 +1661,82 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             return False, "文が長すぎる（200文字超）"
 
         # 適切な語尾チェック
-        proper_endings = ('です。', 'ます。', 'ました。', 'ています。', 'でした。', 'ません。')
-        if not paragraph.endswith(proper_endings):
+        if not paragraph.endswith(_LEAD_PROPER_ENDINGS):
             return False, "適切な敬語で終わっていない"
 
         return True, "OK"
 
     async def _generate_llm_lead_text_with_retry(self, articles, edition, max_retries=3):
-        """文法検証付きリード文生成"""
-
-        for attempt in range(max_retries):
-            try:
-                result = await self._generate_llm_lead_text(articles, edition)
-
-                if not result or 'lead_paragraphs' not in result:
-                    logger.warning(f"Lead text generation attempt {attempt + 1}: No valid response")
-                    continue
-
-                # 各段落を検証
-                valid_paragraphs = []
-                for i, para in enumerate(result.get('lead_paragraphs', [])):
-                    is_valid, reason = self._validate_lead_paragraph(para)
-                    if is_valid:
-                        valid_paragraphs.append(para)
-                        logger.info(f"Lead paragraph {i+1} validated: {para[:50]}...")
-                    else:
-                        logger.warning(f"Invalid paragraph {i+1}: {reason} - {para[:50]}...")
-
-                # 最低2つの有効な段落が必要
-                if len(valid_paragraphs) >= 2:
-                    # 3つに満たない場合は、最後の段落を複製・修正
-                    while len(valid_paragraphs) < 3:
-                        if valid_paragraphs:
-                            # 最後の段落をベースに展望文を作成
-                            base_para = valid_paragraphs[-1]
-                            if 'です。' in base_para:
-                                expansion = "今後もこれらの動向が業界全体に与える影響に注目が集まります。"
-                            else:
-                                expansion = "これらの進展により、AI分野における競争と協力がさらに活発化すると予想されます。"
-                            valid_paragraphs.append(expansion)
-                        else:
-                            break
+        """文法検証付きリード文生成
 
-                    result['lead_paragraphs'] = valid_paragraphs[:3]
-                    logger.info(f"Lead text generation successful on attempt {attempt + 1}")
-                    return result
-                else:
-                    logger.warning(f"Lead text generation attempt {attempt + 1}: Only {len(valid_paragraphs)} valid paragraphs")
+        Attempts run one after another and the next request is only sent when the
+        previous answer failed validation, so a valid first answer costs one call.
+        """
 
+        # The prompt is identical for every attempt, so build it once
+        prompt = self._build_lead_text_prompt(articles, edition)
+        for attempt in range(1, max_retries + 1 if prompt else 1):
+            try:
+                result = await self._generate_llm_lead_text(articles, edition, prompt)
+                accepted = self._accept_lead_text_result(result, attempt)
             except Exception as e:
-                logger.error(f"Lead text generation attempt {attempt + 1} failed: {e}")
+                logger.error(f"Lead text generation attempt {attempt} failed: {e}")
+                continue
+
+            if accepted is not None:
+                return accepted
 
         # 全て失敗した場合は安全なフォールバック
         logger.warning("All lead text generation attempts failed, using fallback")
         return self._generate_safe_fallback_lead_text(articles)
 
+    def _accept_lead_text_result(self, result, attempt: int) -> dict[str, Any] | None:
+        """Validate one LLM lead text result; return it completed to 3 paragraphs, or None."""
+
+        if not result or 'lead_paragraphs' not in result:
+            logger.warning(f"Lead text generation attempt {attempt}: No valid response")
+            return None
+
+        # 各段落を検証
+        valid_paragraphs = []
+        for i, para in enumerate(result.get('lead_paragraphs', [])):
+            is_valid, reason = self._validate_lead_paragraph(para)
+            if is_valid:
+                valid_paragraphs.append(para)
+                logger.info(f"Lead paragraph {i+1} validated: {para[:50]}...")
+            else:
+                logger.warning(f"Invalid paragraph {i+1}: {reason} - {para[:50]}...")
+
+        # 最低2つの有効な段落が必要
+        if len(valid_paragraphs) < 2:
+            logger.warning(f"Lead text generation attempt {attempt}: Only {len(valid_paragraphs)} valid paragraphs")
+            return None
+
+        # 3つに満たない場合は、最後の段落をベースに展望文を作成
+        while len(valid_paragraphs) < 3:
+            base_para = valid_paragraphs[-1]
+            if 'です。' in base_para:
+                expansion = "今後もこれらの動向が業界全体に与える影響に注目が集まります。"
+            else:
+                expansion = "これらの進展により、AI分野における競争と協力がさらに活発化すると予想されます。"
+            valid_paragraphs.append(expansion)
+
+        result['lead_paragraphs'] = valid_paragraphs[:3]
+        logger.info(f"Lead text generation successful on attempt {attempt}")
+        return result
+
     def _generate_safe_fallback_lead_text(self, articles):
         """安全なフォールバック：シンプルで確実なリード文"""
 
         # 記事数をカウント
         article_count = len(articles) if articles else 0
 
-        # 主要企業を抽出
-        companies = set()
-        for article in articles[:5]:
-            if hasattr(article, 'summarized_article') and article.summarized_article:
-                title = article.summarized_article.filtered_article.raw_article.title
-                # 企業名を簡単に抽出
-                for company in ['OpenAI', 'Google', 'Meta', 'Microsoft', 'Anthropic', 'Apple']:
-                    if company in title:
-                        companies.add(company)
+        # 主要企業を抽出（タイトル単位でメモ化されるため、リトライ時は再走査しない）
+        companies = set().union(*(
+            _fallback_companies(article.summarized_article.filtered_article.raw_article.title)
+            for article in articles[:5]
+            if hasattr(article, 'summarized_article') and article.summarized_article
+        ))
 
         main_companies = list(companies)[:2]
         companies_str = "、".join(main_companies) if main_companies else "主要AI企業"
@@ -1082,22 +1762,26 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
         try:
             # First, try to parse as plain text format (new format)
-            lines = response.strip().split('\n')
             paragraphs = []
 
-            for line in lines:
-                line = line.strip()
+            # Only the first three paragraphs are used, so stop scanning lines once found
+            for match in _RE_RESPONSE_LINE.finditer(response):
+                line = match.group().strip()
 
                 # Look for lines that start with "段落" or contain actual content
-                if line.startswith('段落') and ':' in line:
+                labeled = _RE_PARAGRAPH_LABEL.match(line)
+                if labeled:
                     # Extract the content after the colon
-                    content = line.split(':', 1)[1].strip()
+                    content = labeled.group(1).strip()
                     if content and len(content) > 20:
                         paragraphs.append(content)
-                elif len(line) > 30 and any(line.endswith(ending) for ending in ['です。', 'ます。', 'ました。', 'ています。', 'でした。']):
+                elif len(line) > 30 and line.endswith(_LEAD_LINE_ENDINGS):
                     # This looks like a complete sentence
                     paragraphs.append(line)
 
+                if len(paragraphs) == 3:
+                    break
+
             # If we found paragraphs in plain text format, use them
             if len(paragraphs) >= 2:
                 # Clean up each paragraph
@@ -1105,7 +1789,7 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
                 for para in paragraphs[:3]:  # Take up to 3 paragraphs
                     # Remove any remaining formatting artifacts
                     para = para.strip('[]「」')
-                    para = re.sub(r'^\d+\.\s*', '', para)  # Remove numbering
+                    para = _RE_LEADING_NUMBER.sub('', para)  # Remove numbering
 
                     # Validate and fix grammar
                     para = self._fix_paragraph_grammar(para)
@@ -1128,13 +1812,13 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
             # Fallback: Try JSON parsing (legacy format)
             if '```json' in response:
-                json_match = re.search(r'```json\s*(\{.*?\})\s*```', response, re.DOTALL)
+                json_match = _RE_JSON_BLOCK.search(response)
                 if json_match:
                     response = json_match.group(1)
 
             # Try to parse as JSON
             if response.strip().startswith('{'):
-                data = json.loads(response)
+                data = orjson.loads(response) if HAS_ORJSON else json.loads(response)
 
                 if 'lead_paragraphs' in data:
                     lead_paragraphs = data['lead_paragraphs']
@@ -1159,15 +1843,16 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
                             }
 
             # Final fallback: Extract any good sentences from the response
-            all_sentences = re.split(r'[。！？]', response)
             valid_sentences = []
 
-            for sentence in all_sentences:
-                sentence = sentence.strip()
-                if len(sentence) > 30 and not any(skip in sentence.lower() for skip in ['json', '```', '段落', '形式']):
+            for match in _RE_SENTENCE_BODY.finditer(response):
+                sentence = match.group().strip()
+                if len(sentence) > 30 and not _RE_RESPONSE_SKIP.search(sentence):
                     sentence = self._fix_paragraph_grammar(sentence)
                     if sentence:
                         valid_sentences.append(sentence)
+                        if len(valid_sentences) == 3:
+                            break
 
             if len(valid_sentences) >= 2:
                 return {
@@ -1190,39 +1875,32 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
         # Fix common LLM generation issues
         # 1. Remove duplicate sentence endings
-        para = re.sub(r'([。！？])\1+', r'\1', para)
+        para = _RE_DUP_ENDING.sub(r'\1', para)
 
         # 2. Fix missing punctuation between sentences
-        para = re.sub(r'([^\s。！？])([A-Z\u3042-\u3093\u30A2-\u30F3\u4E00-\u9FAF]{3,})', r'\1。\2', para)
+        para = _RE_MISSING_PERIOD.sub(r'\1。\2', para)
 
         # 3. Fix overly long sentences (split at logical points)
         if len(para) > 120:
             # Split at conjunctions but keep them
-            para = re.sub(r'([^\s。！？])(また|さらに|一方|なお|ただし|しかし)', r'\1。\2', para)
-
-        # 4. Remove incomplete sentence patterns
-        para = re.sub(r'([A-Za-z\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+)が。\s*', '', para)
-        para = re.sub(r'([A-Za-z\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+)は。\s*', '', para)
+            para = _RE_SPLIT_CONJUNCTION.sub(r'\1。\2', para)
 
-        # 5. Fix missing particles before nouns
-        para = re.sub(r'([、。])([A-Z][a-z]+)([が|は|を|に|で|と])', r'\1\2\3', para)
-        para = re.sub(r'([A-Za-z\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+)を。\s*', '', para)
-
-        # Fix broken sentence connections
-        para = re.sub(r'([A-Za-z]+)が。([^。]+)', r'\1が\2', para)
-        para = re.sub(r'([A-Za-z]+)は。([^。]+)', r'\1は\2', para)
+        # 4. Remove incomplete sentences ending in a dangling が/は/を particle
+        para = _RE_DANGLING_PARTICLE.sub('', para)
 
         # Remove sentences ending with particles
-        if para.endswith(('は', 'が', 'を', 'に', 'で', 'と', 'から')):
+        if para.endswith(_LEAD_DANGLING_ENDINGS):
             para = para[:-1].rstrip()
 
         # Ensure proper ending
-        if para and not para.endswith(('。', '！', '？', '.', '!', '?')):
-            if any(word in para for word in ['発表', '開始', '公開', '導入', '提供']):
+        if para and not para.endswith(_LEAD_TERMINAL_PUNCT):
+            # 1回の走査で出現した語尾ヒントを集め、従来と同じ優先順位で選ぶ
+            hints = {m.lastgroup for m in _RE_ENDING_HINT.finditer(para)}
+            if 'shimashita' in hints:
                 para += 'しました。'
-            elif any(word in para for word in ['予定', '見込み', '計画', '方針']):
+            elif 'desu' in hints:
                 para += 'です。'
-            elif any(word in para for word in ['期待', '予想', '見通し']):
+            elif 'sareteimasu' in hints:
                 para += 'されています。'
             else:
                 para += '。'
@@ -1230,7 +1908,7 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         # Check length
         if len(para) > 200:
             # Truncate at sentence boundary
-            sentences = re.split(r'([。！？])', para)
+            sentences = _RE_SENTENCE_END_KEEP.split(para)
             if len(sentences) >= 3:
                 para = sentences[0] + sentences[1]
 
@@ -1242,34 +1920,31 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         if not paragraphs:
             return paragraphs
 
-        truncated = []
-        total_chars = 0
-
-        for paragraph in paragraphs:
-            if total_chars + len(paragraph) <= char_limit:
-                # Entire paragraph fits
-                truncated.append(paragraph)
-                total_chars += len(paragraph)
-            else:
-                # Need to truncate this paragraph
-                remaining_chars = char_limit - total_chars
-                if remaining_chars > 30:  # Only truncate if we have reasonable space
-                    try:
-                        # Use proper sentence boundary detection
-                        truncated_para = truncate_at_sentence_boundary(paragraph, max_length=remaining_chars)
-                        if truncated_para and len(truncated_para) > 20:
-                            truncated.append(truncated_para)
-                        break
-                    except:
-                        # Fallback to simple truncation
-                        truncated_para = paragraph[:remaining_chars]
-                        last_sentence_end = truncated_para.rfind('。')
-                        if last_sentence_end > 20:
-                            truncated_para = paragraph[:last_sentence_end + 1]
-                        else:
-                            truncated_para = paragraph[:remaining_chars - 1] + '…'
-                        truncated.append(truncated_para)
-                break  # Stop adding more paragraphs
+        # 累積文字数から、そのまま収まる段落数を一括で求める
+        cumulative = list(accumulate(map(len, paragraphs)))
+        cut = bisect_right(cumulative, char_limit)
+        truncated = paragraphs[:cut]
+        if cut == len(paragraphs):
+            return truncated
+
+        # Need to truncate the boundary paragraph
+        paragraph = paragraphs[cut]
+        remaining_chars = char_limit - (cumulative[cut - 1] if cut else 0)
+        if remaining_chars > 30:  # Only truncate if we have reasonable space
+            try:
+                # Use proper sentence boundary detection
+                truncated_para = truncate_at_sentence_boundary(paragraph, max_length=remaining_chars)
+                if truncated_para and len(truncated_para) > 20:
+                    truncated.append(truncated_para)
+            except:
+                # Fallback to simple truncation
+                truncated_para = paragraph[:remaining_chars]
+                last_sentence_end = truncated_para.rfind('。')
+                if last_sentence_end > 20:
+                    truncated_para = paragraph[:last_sentence_end + 1]
+                else:
+                    truncated_para = paragraph[:remaining_chars - 1] + '…'
+                truncated.append(truncated_para)
 
         return truncated
 
@@ -1280,69 +1955,63 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         lead_text = context.get("lead_text", {})
         articles = context.get("articles", [])
 
-        lines = [
-            f"# {date.strftime('%Y年%m月%d日')} AI NEWS TLDR",
-            "",
-        ]
+        # 各ブロックは空行で終わるため、末尾の改行1つを除けば従来の "\n".join と同一になる
+        buf = io.StringIO()
+        buf.write(f"# {date.strftime('%Y年%m月%d日')} AI NEWS TLDR\n\n")
 
         # Add lead text
         if lead_text and "title" in lead_text:
-            lines.extend([
-                f"### {lead_text['title']}",
-                "",
-            ])
+            buf.write(f"### {lead_text['title']}\n\n")
 
             paragraphs = lead_text.get("paragraphs", [])
             for paragraph in paragraphs:
-                lines.extend([paragraph, ""])
+                buf.write(f"{paragraph}\n\n")
 
             # Removed: "それでは各トピックの詳細を見ていきましょう。"
         else:
-            lines.extend([
-                "### 本日のAI関連ニュース",
-                "",
-                "本日は注目すべきAI関連ニュースがございませんでした。",
-                "",
-            ])
+            buf.write(
+                "### 本日のAI関連ニュース\n\n"
+                "本日は注目すべきAI関連ニュースがございませんでした。\n\n"
+            )
 
         # Add table of contents
-        lines.extend(["### 目次", ""])
+        buf.write("### 目次\n\n")
 
-        visible_articles = [a for a in articles if getattr(a, 'japanese_title', None)]
+        # 目次と本文で共有するタイトル・UPDATE表示を1回で求める
+        visible_articles = [
+            (a, a.japanese_title, " 🆙" if getattr(a, 'is_update', False) else "")
+            for a in articles
+            if getattr(a, 'japanese_title', None)
+        ]
 
-        for i, article in enumerate(visible_articles, 1):
-            title = article.japanese_title[:45] if len(article.japanese_title) > 45 else article.japanese_title
-            update_indicator = " 🆙" if getattr(article, 'is_update', False) else ""
-            lines.append(f"{i}. {title}{update_indicator}")
-            lines.append("")  # Add blank line after each TOC entry
+        for i, (_, title, update_indicator) in enumerate(visible_articles, 1):
+            # Blank line after each TOC entry
+            buf.write(f"{i}. {title[:45]}{update_indicator}\n\n")
 
-        lines.extend(["", "---", ""])
+        buf.write("\n---\n\n")
 
         # Add articles
-        for article in visible_articles:
-            title = article.japanese_title
-            update_indicator = " 🆙" if getattr(article, 'is_update', False) else ""
-            lines.extend([f"### {title}{update_indicator}", ""])
+        for article, title, update_indicator in visible_articles:
+            buf.write(f"### {title}{update_indicator}\n\n")
 
             # Add summary points
             if (article.summarized_article and
                 article.summarized_article.summary and
                 article.summarized_article.summary.summary_points):
 
-                for point in article.summarized_article.summary.summary_points:
-                    lines.append(f"- {point}")
-                lines.append("")
+                buf.write("\n".join(f"- {point}" for point in article.summarized_article.summary.summary_points))
+                buf.write("\n\n")
 
             # 引用ブロック
             if hasattr(article, 'citations') and article.citations:
                 for citation in article.citations:
                     if isinstance(citation, Citation):
-                        lines.extend([self._citation_to_markdown(citation), ""])
+                        buf.write(f"{self._citation_to_markdown(citation)}\n\n")
                     else:
                         # 旧仕様 (str) にも対応
-                        lines.extend([str(citation), ""])
+                        buf.write(f"{citation}\n\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]
 
     def _citation_to_markdown(self, citation: 'Citation') -> str:
         """Convert Citation object to Markdown format."""
@@ -1418,26 +2087,13 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
                 title = article.summarized_article.filtered_article.raw_article.title
                 combined_text = title + " " + " ".join(summary_points)
 
-                # Major companies/products boost score
-                major_entities = [
-                    'OpenAI', 'Google', 'Meta', 'Microsoft', 'Apple', 'Amazon', 'NVIDIA',
-                    'Anthropic', 'DeepMind', 'GPT', 'Claude', 'Gemini', 'ChatGPT'
-                ]
-                for entity in major_entities:
-                    if entity in combined_text:
-                        score += 2.0
-
-                # Impact indicators
-                impact_terms = [
-                    '発表', 'リリース', '開始', '公開', '導入', '実装', '改善', '向上',
-                    '強化', '拡大', '展開', '活用', '応用', '突破', 'breakthrough'
-                ]
-                for term in impact_terms:
-                    if term in combined_text:
-                        score += 1.0
+                # Major companies/products and impact indicators boost score; each distinct
+                # keyword counts once, found in a single scan (weights: _IMPACT_KEYWORD_WEIGHTS)
+                found = {m.group(1) for m in _RE_IMPACT_KEYWORDS.finditer(combined_text)}
+                score += sum(_IMPACT_KEYWORD_WEIGHTS[_IMPACT_OF_KEYWORD[keyword]] for keyword in found)
 
                 # Numerical data increases credibility
-                if re.search(r'\d+%|\d+倍|\d+[年月日]|\$\d+|¥\d+', combined_text):
+                if _RE_NUMERIC_FACT.search(combined_text):
                     score += 1.5
 
                 # Update articles get slight priority
@@ -1521,67 +2177,23 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
     def _extract_companies(self, text: str, title: str) -> list[str]:
         """Extract company names with expanded recognition."""
-        companies = []
         combined_text = text + " " + title
 
-        company_patterns = [
-            r'(OpenAI|ChatGPT|GPT-\d+)',
-            r'(Google|Alphabet|DeepMind|Gemini)',
-            r'(Meta|Facebook|Instagram)',
-            r'(Microsoft|Azure|Copilot)',
-            r'(Apple|iPhone|iPad|macOS)',
-            r'(Amazon|AWS|Alexa)',
-            r'(NVIDIA|Tesla|SpaceX)',
-            r'(Anthropic|Claude)',
-            r'(IBM|Watson)',
-            r'(Samsung|LG|Sony)'
-        ]
-
-        for pattern in company_patterns:
-            matches = re.findall(pattern, combined_text, re.IGNORECASE)
-            companies.extend(matches)
-
-        return list(dict.fromkeys(companies))  # Remove duplicates while preserving order
+        # One scan over all groups; results stay ordered by group, then position, without duplicates
+        return _unique_matches_by_group(_RE_COMPANY_GROUPS, combined_text)
 
     def _extract_products(self, text: str, title: str) -> list[str]:
         """Extract product/technology names."""
-        products = []
         combined_text = text + " " + title
 
-        product_patterns = [
-            r'(GPT-\d+(?:\.\d+)?|ChatGPT|GPT)',
-            r'(Claude(?:-\d+)?)',
-            r'(Gemini(?:\s+\d+\.\d+)?)',
-            r'(LLaMA|Llama)',
-            r'(DALL-E|DALL·E)',
-            r'(Midjourney|Stable Diffusion)',
-            r'(TensorFlow|PyTorch)',
-            r'(Transformer|BERT|T5)'
-        ]
-
-        for pattern in product_patterns:
-            matches = re.findall(pattern, combined_text, re.IGNORECASE)
-            products.extend(matches)
-
-        return list(dict.fromkeys(products))
+        return _unique_matches_by_group(_RE_PRODUCT_GROUPS, combined_text)
 
     def _extract_key_actions(self, text: str) -> list[str]:
         """Extract key business actions."""
         actions = []
 
-        action_patterns = [
-            # Extract action part after company name, avoiding full sentence capture
-            r'(?:が|は)([^。]*?(?:発表|リリース|公開|開始|導入|実装|展開|提供))',
-            r'(?:が|は)([^。]*?(?:向上|改善|強化|拡大|増大|倍増))',
-            r'(?:が|は)([^。]*?(?:値下げ|価格.*?削減|コスト.*?削減))',
-            r'(?:が|は)([^。]*?(?:新機能|新サービス|新製品|新技術))',
-            # Fallback: extract just the action verb and immediate context
-            r'((?:\d+[%倍億ドル]*.*?)?(?:発表|リリース|公開|開始|導入))',
-            r'((?:\d+[%倍]*.*?)?(?:向上|改善|強化))'
-        ]
-
-        for pattern in action_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _RE_KEY_ACTIONS:
+            matches = pattern.findall(text)
             if matches:
                 actions.extend([match.strip() for match in matches if len(match.strip()) > 10])
 
@@ -1589,33 +2201,25 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
     def _extract_metrics(self, text: str) -> list[str]:
         """Extract quantitative metrics."""
-        metrics = []
+        # Most summaries carry no numbers; skip the per-pattern scans entirely
+        if not _RE_HAS_DIGIT.search(text):
+            return []
 
-        metric_patterns = [
-            r'(\d+%(?:.*?(?:向上|改善|削減|増加|減少))?)',
-            r'(\d+倍(?:.*?(?:向上|改善|増加))?)',
-            r'(\$\d+(?:\.\d+)?(?:[MKB]illion)?)',
-            r'(v?\d+\.\d+)',
-            r'(\d+(?:GB|TB|PB))',
-        ]
+        metrics = []
 
-        for pattern in metric_patterns:
-            matches = re.findall(pattern, text)
-            metrics.extend(matches)
+        for pattern in _RE_METRICS:
+            metrics.extend(pattern.findall(text))
 
         return metrics
 
     def _extract_business_context(self, text: str) -> str:
         """Extract business/impact context."""
-        context_patterns = [
-            r'([^。]*(?:企業|ビジネス|業界|市場|競争)[^。]*)',
-            r'([^。]*(?:活用|応用|導入|実用)[^。]*)',
-            r'([^。]*(?:開発者|ユーザー|顧客)[^。]*)',
-            r'([^。]*(?:影響|効果|成果|結果)[^。]*)'
-        ]
+        # A context shorter than 16 characters is never returned
+        if len(text) <= 15:
+            return ""
 
-        for pattern in context_patterns:
-            match = re.search(pattern, text)
+        for pattern in _RE_BUSINESS_CONTEXT:
+            match = pattern.search(text)
             if match:
                 context = match.group(1).strip()
                 if len(context) > 15 and len(context) < 100:
@@ -1631,11 +2235,9 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
         # Look for complementary information in subsequent points
         for point in summary_points[1:]:
-            if any(keyword in point for keyword in [
-                '一方', 'また', 'さらに', '加えて', '同時に', '並行して'
-            ]):
+            if _RE_CONNECTIVE.search(point):
                 # Extract the contrasting or additional information
-                context_match = re.search(r'([^。]*(?:発表|開始|導入|実装)[^。]*)', point)
+                context_match = _RE_ANNOUNCEMENT_CLAUSE.search(point)
                 if context_match and len(context_match.group(1)) > 20:
                     return f"一方、{context_match.group(1).strip()}。"
 
@@ -1647,25 +2249,25 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         highlights = []
 
         # Analyze themes across articles
-        all_text = []
-        for article in articles:
+        combined_text = " ".join(chain.from_iterable(
+            article.summarized_article.summary.summary_points
+            for article in articles
             if (article.summarized_article and
                 article.summarized_article.summary and
-                article.summarized_article.summary.summary_points):
-                all_text.extend(article.summarized_article.summary.summary_points)
-
-        combined_text = " ".join(all_text)
+                article.summarized_article.summary.summary_points)
+        ))
+        found = {_HIGHLIGHT_OF_KEYWORD[m.group(1)] for m in _RE_HIGHLIGHT_KEYWORDS.finditer(combined_text)}
 
         # Technology themes
-        if any(term in combined_text for term in ['LLM', 'GPT', '言語モデル', 'AI']):
+        if "llm" in found:
             highlights.append("大規模言語モデル（LLM）分野では複数の重要な技術進展が報告され、実用化に向けた動きが加速しています。")
 
         # Business application themes
-        if any(term in combined_text for term in ['企業', 'ビジネス', '導入', '活用']):
+        if "business" in found:
             highlights.append("企業におけるAI活用が本格化し、具体的な業務改善や新サービス創出の事例が相次いで発表されています。")
 
         # Research and development themes
-        if any(term in combined_text for term in ['研究', '開発', '技術', '性能']):
+        if "research" in found:
             highlights.append("AI研究分野では性能向上と実用性を両立させる技術開発が進み、産業界への影響が期待されています。")
 
         return highlights
@@ -1673,20 +2275,7 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
     def _extract_key_themes(self, articles: list[ProcessedArticle]) -> list[str]:
         """Extract key themes from articles."""
 
-        # Common AI themes and their keywords
-        theme_keywords = {
-            "OpenAI・GPT関連": ["openai", "gpt", "chatgpt"],
-            "Google・Gemini関連": ["google", "gemini", "bard"],
-            "Anthropic・Claude関連": ["anthropic", "claude"],
-            "企業・ビジネス": ["企業", "ビジネス", "投資", "資金調達", "startup"],
-            "研究・技術": ["研究", "論文", "技術", "開発", "breakthrough"],
-            "規制・政策": ["規制", "政策", "法律", "政府", "policy"],
-            "量子コンピュータ": ["量子", "quantum"],
-            "ロボティクス": ["ロボット", "robot", "自動化"],
-            "画像生成": ["画像生成", "stable diffusion", "midjourney", "dall-e"]
-        }
-
-        # Count theme occurrences
+        # Count theme occurrences (keywords: _THEME_KEYWORDS)
         theme_counts = {}
 
         for article in articles:
@@ -1694,15 +2283,15 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             content = ' '.join(article.summarized_article.summary.summary_points).lower()
             text = f"{title} {content}"
 
-            for theme, keywords in theme_keywords.items():
-                for keyword in keywords:
-                    if keyword in text:
-                        theme_counts[theme] = theme_counts.get(theme, 0) + 1
-                        break  # Count theme only once per article
+            # Count theme only once per article; iterate in table order so ties rank as before
+            found = {_THEME_OF_KEYWORD[m.group(1)] for m in _RE_THEME_KEYWORDS.finditer(text)}
+            for theme in _THEME_KEYWORDS:
+                if theme in found:
+                    theme_counts[theme] = theme_counts.get(theme, 0) + 1
 
         # Return top themes
-        sorted_themes = sorted(theme_counts.items(), key=lambda x: x[1], reverse=True)
-        return [theme for theme, count in sorted_themes[:3] if count > 0]
+        top_themes = heapq.nlargest(3, theme_counts.items(), key=lambda x: x[1])
+        return [theme for theme, count in top_themes if count > 0]
 
     def _generate_specific_theme_title(self, themes: list[str], articles: list[ProcessedArticle]) -> str | None:
         """具体的なテーマタイトルを生成（汎用表現を回避）"""
@@ -1713,26 +2302,17 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
             for article in articles[:3]:  # 上位3記事から抽出
                 raw_article = article.summarized_article.filtered_article.raw_article
-                text = f"{raw_article.title} {raw_article.content or ''}"
+                # 本文込みのテキストは長いので小文字化は記事ごとに1回だけ行う
+                text = f"{raw_article.title} {raw_article.content or ''}".lower()
 
                 # 企業名抽出
-                company_patterns = [
-                    'OpenAI', 'Google', 'Meta', 'Microsoft', 'Anthropic', 'Apple',
-                    'Amazon', 'Tesla', 'NVIDIA', 'DeepMind', 'LinkedIn', 'GitHub'
-                ]
-
-                for company in company_patterns:
-                    if company.lower() in text.lower() and company not in companies:
+                for company, needle in _THEME_TITLE_COMPANIES:
+                    if needle in text and company not in companies:
                         companies.append(company)
 
                 # 技術・製品名抽出
-                tech_patterns = [
-                    'ChatGPT', 'GPT-4', 'Gemini', 'Claude', 'Llama', 'Copilot',
-                    'API', 'CLI', 'LLM', 'Agent', 'RAG', 'Transformer'
-                ]
-
-                for tech in tech_patterns:
-                    if tech.lower() in text.lower() and tech not in technologies:
+                for tech, needle in _THEME_TITLE_TECHNOLOGIES:
+                    if needle in text and tech not in technologies:
                         technologies.append(tech)
 
             # 具体的なタイトルパターンを生成
@@ -1798,10 +2378,10 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
         output_file = output_path / filename
 
-        # Write content
+        # Write content in one call to a temp file, then rename it into place so a
+        # crash mid-write never leaves a truncated newsletter (or a stray .tmp) behind
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            _write_bytes_atomic(output_file, content.encode('utf-8'))
 
             if HAS_LOGGER:
                 logger.info("Newsletter saved", file=str(output_file))
@@ -1827,9 +2407,9 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
     def _slugify_filter(self, text: str) -> str:
         """Jinja2 filter to create URL-friendly slugs."""
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _RE_HTML_TAG.sub('', text)
         text = text.lower()
-        text = re.sub(r'[^\w\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+', '-', text)
+        text = _RE_SLUG_SEPARATOR.sub('-', text)
         text = text.strip('-')
         if len(text) > 50:
             text = text[:50].rstrip('-')
@@ -1895,7 +2475,7 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             return text
 
         # Clean hash marks that might leak into title (Fix for PRD F-5)
-        text = re.sub(r'^#+\s*', '', text.strip())
+        text = _RE_TITLE_HASH.sub('', text.strip())
 
         # For TOC, we want to show meaningful content but avoid extremely long entries
         max_toc_length = 80  # Optimal length for TOC entries
@@ -1906,8 +2486,7 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
         # Special handling for titles with quoted content like 「Deep Research」
         # Try to include the quoted part if possible
-        quote_pattern = r'「([^」]+)」'
-        quote_match = re.search(quote_pattern, text)
+        quote_match = _RE_QUOTED.search(text)
 
         if quote_match:
             quote_start = quote_match.start()
@@ -1956,18 +2535,21 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         # Look for good breaking points within the limit
         snippet = text[:max_toc_length]
 
+        # Only break points past 60% of the target length count, so each search is
+        # confined to that tail of the snippet instead of rescanning all of it
+        min_break_pos = int(max_toc_length * 0.6) + 1
+
         # Priority: complete phrases or natural boundaries
         # 1. Try to break at punctuation
-        for punct in ['、', '。', '・']:
-            last_punct = snippet.rfind(punct)
-            if last_punct > max_toc_length * 0.6:  # At least 60% of target length
+        for punct in ('、', '。', '・'):
+            last_punct = snippet.rfind(punct, min_break_pos)
+            if last_punct != -1:
                 return snippet[:last_punct + 1].rstrip()
 
         # 2. Try to break after particles (but not certain ones that need completion)
-        safe_particles = ['で', 'から', 'まで', 'より', 'にて']
-        for particle in safe_particles:
-            last_pos = snippet.rfind(particle)
-            if last_pos > max_toc_length * 0.6:
+        for particle in ('で', 'から', 'まで', 'より', 'にて'):
+            last_pos = snippet.rfind(particle, min_break_pos)
+            if last_pos != -1:
                 return snippet[:last_pos + len(particle)].rstrip() + '…'
 
         # 3. Avoid breaking in the middle of important terms
@@ -1981,9 +2563,7 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             # - ASCII words
             # - Katakana words
             # - Numbers
-            if (char.isascii() and char.isalnum() and next_char.isascii() and next_char.isalnum()) or \
-               (ord('ァ') <= ord(char) <= ord('ヶ') and ord('ァ') <= ord(next_char) <= ord('ヶ')) or \
-               (char.isdigit() and next_char.isdigit()):
+            if _toc_char_kind(char) & _toc_char_kind(next_char):
                 safe_pos -= 1
                 continue
             else:
@@ -1993,7 +2573,7 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         result = text[:safe_pos].rstrip()
 
         # Clean up any trailing particles that make it incomplete
-        if result.endswith(('は', 'が', 'を', 'に', 'へ', 'と')):
+        if result.endswith(_TRAILING_PARTICLES):
             result = result[:-1].rstrip()
 
         # Add ellipsis if we actually truncated
@@ -2043,39 +2623,22 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         Returns:
             Dictionary with validation results and suggested improvements
         """
-        import re
-
         issues = []
         suggestions = []
         score = 100  # Start with perfect score
 
         # Check 1: Duplicate word patterns
-        duplicate_patterns = [
-            (r'(\w+)\s+\1\b', '同じ単語が連続しています'),
-            (r'(LLM|AI|GPT)の技術.*?\1', 'LLM/AI用語の重複があります'),
-            (r'(\w+)技術\s*\1', '技術用語の重複があります')
-        ]
-
-        for pattern, message in duplicate_patterns:
-            if re.search(pattern, title):
+        for pattern, message in _RE_TITLE_DUPLICATES:
+            if pattern.search(title):
                 issues.append(f'重複パターン: {message}')
                 suggestions.append('重複した単語を除去してください')
                 score -= 30
 
         # Check 2: Generic/vague titles
-        generic_patterns = [
-            r'^LLM（大規模言語モデル）$',
-            r'^技術進展$',
-            r'^AI技術$',
-            r'^新技術$'
-        ]
-
-        for pattern in generic_patterns:
-            if re.search(pattern, title):
-                issues.append('汎用的すぎるタイトルです')
-                suggestions.append('より具体的な情報を含めてください')
-                score -= 40
-                break
+        if _RE_TITLE_GENERIC.search(title):
+            issues.append('汎用的すぎるタイトルです')
+            suggestions.append('より具体的な情報を含めてください')
+            score -= 40
 
         # Check 3: Incomplete titles (cut off)
         if title.endswith('...'):
@@ -2090,7 +2653,7 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             score -= 15
 
         # Check 5: Too many emoji
-        emoji_count = len(re.findall(r'[�-􏰀-�☀-⟿]', title))
+        emoji_count = len(_RE_TITLE_EMOJI.findall(title))
         if emoji_count > 2:
             issues.append('絵文字が多すぎます')
             suggestions.append('絵文字は1-2個までに抑えてください')
@@ -2125,23 +2688,21 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         Returns:
             Improved title
         """
-        import re
-
         improved_title = title
 
         # Fix duplicate patterns
-        improved_title = re.sub(r'(\w+)\s+\1\b', r'\1', improved_title)
-        improved_title = re.sub(r'(LLM|AI|GPT)(の技術).*?\1', r'\1\2', improved_title)
-        improved_title = re.sub(r'(\w+)技術\s*\1', r'\1技術', improved_title)
+        improved_title = _RE_TITLE_DUP_WORD.sub(r'\1', improved_title)
+        improved_title = _RE_TITLE_DUP_LLM_TERM.sub(r'\1\2', improved_title)
+        improved_title = _RE_TITLE_DUP_TECH.sub(r'\1技術', improved_title)
 
         # Remove trailing ellipsis and try to complete
         if improved_title.endswith('...'):
             improved_title = improved_title[:-3].strip()
-            if not improved_title.endswith(('。', 'です', 'ます', 'た')):
+            if not improved_title.endswith(_TITLE_COMPLETE_ENDINGS):
                 improved_title += 'を発表'
 
         # Clean up spacing
-        improved_title = re.sub(r'\s+', ' ', improved_title.strip())
+        improved_title = _RE_WHITESPACE_RUN.sub(' ', improved_title.strip())
 
         return improved_title
 
@@ -2157,19 +2718,16 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         """🔥 ULTRA THINK: 統合ヘッドライン生成で【続報】+🆙重複を完全防止"""
 
         # 🔥 ULTRA THINK: 【続報】テキスト完全除去強化
-        summary_sentence = re.sub(r'【?続報】?[:：]?\s*', '', summary_sentence)
-        summary_sentence = re.sub(r'^続報[:：]\s*', '', summary_sentence)
-        summary_sentence = re.sub(r'続報\s*[：:]\s*', '', summary_sentence)  # 中間位置の続報も除去
-        summary_sentence = re.sub(r'\s*続報$', '', summary_sentence)  # 末尾の続報も除去
+        summary_sentence = _strip_sequel_marker(summary_sentence)  # 先頭・中間・末尾の続報を除去
 
         # STEP 2: Extract key entity for specificity
-        entity_match = re.search(r'「([^」]+)」|\b([A-Z][a-zA-Z0-9]+)\b', summary_sentence)
+        entity_match = _RE_HEADLINE_ENTITY.search(summary_sentence)
         entity = ""
         if entity_match:
             entity = entity_match.group(1) or entity_match.group(2)
 
         # STEP 3: Truncate for proper length
-        truncated_summary = ensure_sentence_completeness(summary_sentence, self.settings.processing.title_short_length)
+        truncated_summary = ensure_sentence_completeness(summary_sentence, self._title_short_length)
 
         # STEP 4: Build base title
         if entity and entity not in truncated_summary:
@@ -2204,49 +2762,32 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
                 first_point = summary_points[0]
 
                 # 🔥 ULTRA THINK: 【続報】テキスト完全除去強化（フォールバック）
-                first_point = re.sub(r'【?続報】?[:：]?\s*', '', first_point)
-                first_point = re.sub(r'^続報[:：]\s*', '', first_point)
-                first_point = re.sub(r'続報\s*[：:]\s*', '', first_point)  # 中間位置
-                first_point = re.sub(r'\s*続報$', '', first_point)  # 末尾
-                first_point = re.sub(r'続報.*?、', '', first_point)  # 続報...、パターン
+                first_point = _strip_sequel_marker(first_point)  # 先頭・中間・末尾
+                if '続報' in first_point:  # 上の除去後に残った場合のみ
+                    first_point = _RE_SEQUEL_CLAUSE.sub('', first_point)  # 続報...、パターン
 
                 # Extract key entities and actions - 拡張版
-                company_match = re.search(
-                    r'(OpenAI|Google|Meta|Microsoft|Anthropic|Apple|Amazon|NVIDIA|DeepMind|Agentica|Together AI|'
-                    r'Hugging Face|TechCrunch|VentureBeat|WIRED|IEEE|NextWord|SemiAnalysis|'
-                    r'[A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*?)(?:社|が|は|の|、)',
-                    first_point
-                )
+                company_match = _RE_FALLBACK_TITLE_COMPANY.search(first_point)
                 company = company_match.group(1) if company_match else None
 
                 # 数値・成果の抽出強化
-                numbers_match = re.search(r'(\d+(?:\.\d+)?[%万億円ドル倍件名]|Pass@1\s+\d+\.\d+%|SOTA|年間\d+万ドル)', first_point)
+                numbers_match = _RE_FALLBACK_TITLE_NUMBERS.search(first_point)
                 numbers = numbers_match.group(1) if numbers_match else None
 
                 # Pattern matching for key actions/technologies - 拡張版
-                action_patterns = [
-                    (r'(DeepSWE-Preview|コーディングエージェント)', 'AI開発ツール'),
-                    (r'(強化学習|RL|GRPO\+\+|rLLM)', '機械学習技術'),
-                    (r'(Pass@1\s+\d+\.\d+%|SOTA|ベンチマーク)', '性能指標'),
-                    (r'(SWE-Bench|Qwen3-32B)', 'AI基盤'),
-                    (r'(年間\d+万ドル|収益|売上|投資)', '事業展開'),
-                    (r'(コンサルティング|サービス拡大)', 'ビジネス'),
-                    (r'(\d+名?の?(?:AI)?研究者)', '研究者'),
-                    (r'(トップ.*?研究者)', '人材'),
-                    (r'(新機能|新サービス|新技術)', 'リリース'),
-                    (r'(発表|公開|開始|導入|獲得|雇用)', None),
-                    (r'(ChatGPT|Claude|Gemini|GPT-\d+)', 'AI'),
-                    (r'(Deep Research|RAG|LLM)', '技術'),
-                ]
-
                 key_action = None
                 action_type = None
-                for pattern, type_hint in action_patterns:
-                    match = re.search(pattern, first_point)
-                    if match:
-                        key_action = match.group(1)
-                        action_type = type_hint
-                        break
+                # 一回の走査で最優先パターンの最左一致を求める（位置は単調増加するため
+                # 各パターンの初出が最左一致になる）
+                best = None
+                for match in _RE_FALLBACK_TITLE_ACTIONS.finditer(first_point):
+                    if best is None or match.lastindex < best.lastindex:
+                        best = match
+                        if best.lastindex == 1:
+                            break
+                if best:
+                    key_action = best.group(best.lastindex)
+                    action_type = _FALLBACK_TITLE_ACTION_TYPES[best.lastindex - 1]
 
                 # Build base title - 改良版
                 if company and key_action and numbers:
@@ -2335,69 +2876,46 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             logger.debug(f"Centralized duplicate removal failed: {e}")
 
         # Remove duplicate phrases and concatenation errors first
-        title = re.sub(r'(.+?)(と発表|と報告|と述べ|と語っ|と表明)(.*?)\2', r'\1\2\3', title)
+        title = _RE_CLEAN_REPORTED_DUP.sub(r'\1\2\3', title)
         # Fix duplicate company/product names (e.g., "Claude CodeAI Claude" -> "Claude Code") - more conservative
-        title = re.sub(r'\b(\w+)\s+(AI|Code|Pro|Plus)\s+\1\b', r'\1 \2', title)
-        title = re.sub(r'\b(\w+)(AI|Code|Pro|Plus)\1\b', r'\1\2', title)
+        title = _RE_CLEAN_SPACED_PRODUCT_DUP.sub(r'\1 \2', title)
+        title = _RE_CLEAN_JOINED_PRODUCT_DUP.sub(r'\1\2', title)
         # Fix duplicate adjacent words
-        title = re.sub(r'(\b\w+)\s+\1\b', r'\1', title)
+        title = _RE_CLEAN_ADJACENT_WORD_DUP.sub(r'\1', title)
 
         # Legacy patterns - kept for additional coverage beyond centralized patterns
-        # Pattern 9: Specific numeric/text duplicates like "年間1000万ドルで年間1000万ドル"
-        title = re.sub(r'(年間\d+[万億千]?[ドル円])(で|を|が|は)\1', r'\1', title)
-        title = re.sub(r'(\d+[万億千]?[ドル円])(で|を|が|は)\1', r'\1', title)
-        # Pattern 10: More specific duplicates with currencies and numbers
-        title = re.sub(r'(\d+万ドル)(で|を|が|は)(\d+万ドル)', r'\1', title)
-        title = re.sub(r'(年間\d+万ドル)(で|を|が|は)(年間\d+万ドル)', r'\1', title)
+        for pattern in _RE_CLEAN_AMOUNT_DUPS:
+            title = pattern.sub(r'\1', title)
 
-        # Debug logging for title cleaning (can be removed in production)
+        # Debug logging for title cleaning
         if '年間' in title and '万ドル' in title:
-            print(f"DEBUG: Currency title after cleaning: '{title}'")
+            logger.debug(f"Currency title after cleaning: '{title}'")
 
         # Remove verb endings like "〜と報じられました" or "〜と発表しました"
         # to ensure the title is a proper headline (体言止め).
-        verb_endings_pattern = r"(?:と報じられました|と発表しました|と述べました|と語りました|と表明しました|と明らかにしました|氏は|氏は、|を発表|を報告)$"
-        cleaned_title = re.sub(verb_endings_pattern, '', title).strip()
+        cleaned_title = _strip_suffix(title, _TITLE_VERB_SUFFIXES).strip()
 
         # Remove incomplete sentence patterns
-        incomplete_patterns = r"(?:について|に関して|において|に対して|をめぐって)$"
-        cleaned_title = re.sub(incomplete_patterns, '', cleaned_title).strip()
+        cleaned_title = _strip_suffix(cleaned_title, _TITLE_INCOMPLETE_SUFFIXES).strip()
 
         # Additional cleanup for cases where a comma is left at the end
         if cleaned_title.endswith(('、', ',', '。', '：', ':')):
             cleaned_title = cleaned_title[:-1].strip()
 
         # Remove trailing particles that make titles incomplete and fix them properly
-        if cleaned_title.endswith(('が', 'を', 'に', 'は', 'で', 'と', 'での', 'のため', 'により', 'によって', 'として')):
-            # 適切な結びでタイトルを完成させる
-            if cleaned_title.endswith('が'):
-                cleaned_title = cleaned_title[:-1] + 'を発表'
-            elif cleaned_title.endswith('を'):
-                cleaned_title = cleaned_title[:-1] + 'が進展'
-            elif cleaned_title.endswith(('に', 'で')):
-                cleaned_title = cleaned_title[:-1] + 'が加速'
-            else:
-                cleaned_title = cleaned_title.rstrip('はとでのためによりによってとして').strip()
+        # 適切な結びでタイトルを完成させる
+        completion = _TITLE_PARTICLE_COMPLETIONS.get(cleaned_title[-1:])
+        if completion is not None:
+            cleaned_title = cleaned_title[:-1] + completion
+        elif cleaned_title.endswith(_TITLE_DROPPED_PARTICLES):
+            cleaned_title = cleaned_title.rstrip('はとでのためによりによってとして').strip()
 
         return cleaned_title
 
     def _is_highly_generic_title(self, title: str) -> bool:
         """Check if the title is too generic or low-quality."""
         # Reject generic titles and incomplete patterns
-        highly_generic_patterns = [
-            r'^AI関連ニュース$',
-            r'^最新AI動向$',
-            r'^技術ニュース$',
-            r'^業界動向$',
-            r'^最新情報$',
-            r'^.*について$',
-            r'^.*に関して$',
-            r'^.*を発表🆙$',  # Broken titles ending with emoji
-            r'^.*の$',  # Titles ending with incomplete possessive
-            r'.*を発表しながら',  # Incomplete "while announcing" patterns
-        ]
-
-        return any(re.search(pattern, title, re.IGNORECASE) for pattern in highly_generic_patterns)
+        return _RE_HIGHLY_GENERIC_TITLE.search(title) is not None
 
     def _generate_specific_title_from_content(self, article: ProcessedArticle) -> str:
         """Generate a more specific title when the original is too generic."""
@@ -2407,25 +2925,21 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             summary_points = article.summarized_article.summary.summary_points
 
             # Try to extract company names from summary
-            major_companies = ['OpenAI', 'Google', 'Microsoft', 'Apple', 'Meta', 'Amazon', 'Anthropic',
-                              'DeepMind', 'Hugging Face', 'NVIDIA', 'Intel', 'AMD', 'Tesla', 'Uber']
-
-            companies = []
-            for point in summary_points:
-                for company in major_companies:
-                    if company in point:
-                        companies.append(company)
+            companies = [
+                company
+                for point in summary_points
+                for company in _SPECIFIC_TITLE_COMPANIES
+                if company in point
+            ]
 
             # Remove duplicates while preserving order
             unique_companies = list(dict.fromkeys(companies))
 
-            # Extract key action verbs
-            actions = []
-            for point in summary_points:
-                for action in ['発表', '発売', '公開', 'リリース', '開始', '提供', '導入', '開発', '改良', '向上']:
-                    if action in point:
-                        actions.append(action)
-                        break
+            # Extract the key action verb (only the first point that has one is used)
+            action = next(
+                (action for point in summary_points for action in _SPECIFIC_TITLE_ACTIONS if action in point),
+                None,
+            )
 
             # Build title
             title_parts = []
@@ -2437,8 +2951,8 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
                     title_parts.append(f"と{unique_companies[1]}")
 
             # Add action if found
-            if actions:
-                title_parts.append(f"、{actions[0]}")
+            if action:
+                title_parts.append(f"、{action}")
 
             # Add subject matter
             first_point = summary_points[0] if summary_points else ""
@@ -2486,30 +3000,28 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
                         summary_points = article.summarized_article.summary.summary_points
                         title = article.summarized_article.filtered_article.raw_article.title
 
-                        # Extract company names
-                        for company in ['OpenAI', 'Google', 'Microsoft', 'Apple', 'Meta', 'Amazon', 'Anthropic',
-                                       'DeepMind', 'Hugging Face', 'NVIDIA', 'Tesla', 'AgenticaAI', 'Together AI']:
-                            if company in " ".join(summary_points) or company in title:
+                        # Extract company names (join the points once, not per company)
+                        joined_points = " ".join(summary_points)
+                        for company in _SPECIFIC_LEAD_COMPANIES:
+                            if company in joined_points or company in title:
                                 companies_mentioned.add(company)
 
                         # Extract key developments (first point simplified)
                         if summary_points:
                             first_point = summary_points[0]
                             # Simplify and extract key action
-                            for action in ['発表', 'リリース', '開発', '達成', '実現', '提供', '公開', '開始']:
-                                if action in first_point:
-                                    # Extract the essence of the development
-                                    if 'コーディング' in first_point and '記録' in first_point:
-                                        key_developments.append('AIエージェントのコーディング性能向上')
-                                    elif 'billion' in first_point or '億' in first_point or 'revenue' in first_point:
-                                        key_developments.append('AI企業の収益拡大')
-                                    elif 'Context Engineering' in first_point or 'プロンプト' in first_point:
-                                        key_developments.append('プロンプト技術の進化')
-                                    elif 'LLM' in first_point and '学習' in first_point:
-                                        key_developments.append('LLM開発手法の体系化')
-                                    elif 'Code Hook' in first_point or 'ツール' in first_point:
-                                        key_developments.append('開発ツールの機能強化')
-                                    break
+                            if any(action in first_point for action in _SPECIFIC_LEAD_ACTIONS):
+                                # Extract the essence of the development
+                                if 'コーディング' in first_point and '記録' in first_point:
+                                    key_developments.append('AIエージェントのコーディング性能向上')
+                                elif 'billion' in first_point or '億' in first_point or 'revenue' in first_point:
+                                    key_developments.append('AI企業の収益拡大')
+                                elif 'Context Engineering' in first_point or 'プロンプト' in first_point:
+                                    key_developments.append('プロンプト技術の進化')
+                                elif 'LLM' in first_point and '学習' in first_point:
+                                    key_developments.append('LLM開発手法の体系化')
+                                elif 'Code Hook' in first_point or 'ツール' in first_point:
+                                    key_developments.append('開発ツールの機能強化')
                 except Exception:
                     continue
 
@@ -2560,39 +3072,6 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             logger.warning(f"Failed to generate specific lead paragraphs: {e}")
             return []
 
-    def _shorten_summary_points(self, summary_points: list[str]) -> list[str]:
-        """Shorten summary points to fit within character limits."""
-
-        if not summary_points:
-            return []
-
-        cleaned_points = []
-
-        for point in summary_points:
-            if not isinstance(point, str):
-                continue
-
-            # Strip whitespace
-            point = point.strip()
-
-            # Skip empty or very short points
-            if len(point) < 10:
-                continue
-
-            # Remove bullet point markers if present
-            point = re.sub(r'^[\-\*\•・\u2022]\s*', '', point)
-
-            # Remove redundant prefixes
-            point = re.sub(r'^(また、|さらに、|なお、|一方、)', '', point)
-
-            # Ensure point ends with proper punctuation
-            if not point.endswith(('。', '！', '？')):
-                point += '。'
-
-            cleaned_points.append(point)
-
-        return cleaned_points
-
     def _generate_japanese_title(self, article: ProcessedArticle) -> str:
         """
         Generate a Japanese title for an article using template-based rules.
@@ -2605,9 +3084,6 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         Returns:
             Generated Japanese title string
         """
-        # Ensure regular expressions are available throughout this method
-        import re
-
         try:
             raw_article = article.summarized_article.filtered_article.raw_article
             summary_points = article.summarized_article.summary.summary_points
@@ -2738,35 +3214,18 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             return None
 
         # Pattern to extract key actions/topics from Japanese summary points
-        action_patterns = [
-            r'(.{5,20}?を発表)',  # "XXXを発表"
-            r'(.{5,20}?をリリース)',  # "XXXをリリース"
-            r'(.{5,20}?を開始)',  # "XXXを開始"
-            r'(.{5,20}?を導入)',  # "XXXを導入"
-            r'(.{5,20}?が向上)',  # "XXXが向上"
-            r'(.{5,20}?を改善)',  # "XXXを改善"
-            r'(.{5,20}?に成功)',  # "XXXに成功"
-            r'(.{5,20}?を実現)',  # "XXXを実現"
-            r'(.{5,20}?が可能)',  # "XXXが可能"
-        ]
-
-        for pattern in action_patterns:
-            match = re.search(pattern, summary_point)
+        for pattern in _RE_TOPIC_ACTIONS:
+            match = pattern.search(summary_point)
             if match:
                 topic = match.group(1).strip()
                 # Clean up common prefixes
-                topic = re.sub(r'^(新しい|最新の|次世代の)', '', topic)
+                topic = _RE_TOPIC_PREFIX.sub('', topic)
                 if len(topic) >= 5:  # Ensure meaningful length
                     return topic
 
         # Fallback to noun phrase extraction
-        noun_patterns = [
-            r'([A-Za-z0-9]{3,}[の]?(?:API|SDK|サービス|機能|技術|システム|プラットフォーム))',
-            r'([ぁ-ん]{2,}[の]?(?:機能|技術|サービス|システム|性能|精度))',
-        ]
-
-        for pattern in noun_patterns:
-            match = re.search(pattern, summary_point)
+        for pattern in _RE_TOPIC_NOUNS:
+            match = pattern.search(summary_point)
             if match:
                 return match.group(1).strip()
 
@@ -2787,16 +3246,16 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             return ""
 
         # Remove any markdown syntax
-        heading = re.sub(r'[#*_`\[\]]', '', heading)
+        heading = _RE_MARKDOWN_SYNTAX.sub('', heading)
 
         # Remove URLs
-        heading = re.sub(r'https?://\S+', '', heading)
+        heading = _RE_URL.sub('', heading)
 
         # Clean up extra whitespace
         heading = ' '.join(heading.split())
 
         # Remove trailing punctuation
-        heading = re.sub(r'[.,:;!?]+$', '', heading)
+        heading = _RE_TRAILING_PUNCT.sub('', heading)
 
         return heading.strip()
 
@@ -2815,32 +3274,7 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
             return ""
 
         # Common terminology normalizations
-        normalizations = {
-            # AI model names
-            r'\bGPT[\s-]?4[\s-]?o[\s-]?mini\b': 'GPT-4o-mini',
-            r'\bGPT[\s-]?4[\s-]?o\b': 'GPT-4o',
-            r'\bGPT[\s-]?3\.5\b': 'GPT-3.5',
-            r'\bClaude[\s-]?3\.5\b': 'Claude 3.5',
-            r'\bGemini[\s-]?Pro\b': 'Gemini Pro',
-
-            # Company names
-            r'\bOpenAI\b': 'OpenAI',
-            r'\bAnthropic\b': 'Anthropic',
-            r'\bGoogle\b': 'Google',
-            r'\bMicrosoft\b': 'Microsoft',
-            r'\bMeta\b': 'Meta',
-
-            # Technology terms
-            r'\bAI\b': 'AI',
-            r'\bML\b': 'ML',
-            r'\bLLM\b': 'LLM',
-            r'\bAPI\b': 'API',
-        }
-
-        for pattern, replacement in normalizations.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-
-        return text
+        return _RE_TERMINOLOGY.sub(lambda m: _TERMINOLOGY_CANONICAL[m.lastindex - 1], text)
 
     def _cleanup_summary_points(self, summary_points: list[str]) -> list[str]:
         """
@@ -2870,10 +3304,10 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
                 continue
 
             # Remove bullet point markers if present
-            point = re.sub(r'^[\-\*\•・\u2022]\s*', '', point)
+            point = _RE_BULLET_MARKER.sub('', point)
 
             # Remove redundant prefixes
-            point = re.sub(r'^(また、|さらに、|なお、|一方、)', '', point)
+            point = _RE_REDUNDANT_PREFIX.sub('', point)
 
             # Ensure point ends with proper punctuation
             if not point.endswith(('。', '！', '？')):
@@ -2883,6 +3317,9 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
 
         return cleaned_points
 
+    # The two names were separate, identical implementations; keep the older one as an alias
+    _shorten_summary_points = _cleanup_summary_points
+
     def _validate_and_fix_newsletter_content(
         self,
         content: str,
@@ -2902,22 +3339,26 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         if not content:
             return ""
 
-        # Fix common formatting issues
-        content = re.sub(r'\n{3,}', '\n\n', content)  # Limit consecutive newlines
-        content = re.sub(r'[ \t]+$', '', content, flags=re.MULTILINE)  # Remove trailing whitespace
-        content = content.strip()
+        # Fix common formatting issues in one pass over the lines: limit consecutive
+        # newlines (a run of empty lines keeps only its first) and remove trailing whitespace
+        fixed_lines = []
+        previous_empty = False
+        for line in content.split('\n'):
+            is_empty = not line
+            if not (is_empty and previous_empty):
+                fixed_lines.append(line.rstrip(' \t'))
+            previous_empty = is_empty
+        content = '\n'.join(fixed_lines).strip()
 
         # Ensure proper line endings
         if not content.endswith('\n'):
             content += '\n'
 
         # Validate that all articles are represented
-        missing_articles = []
-        for article in articles:
-            if article.japanese_title:
-                # Check if article title appears in content
-                if article.japanese_title not in content:
-                    missing_articles.append(article)
+        missing_articles = [
+            article for article in articles
+            if article.japanese_title and article.japanese_title not in content
+        ]
 
         if missing_articles:
             logger.warning(f"Found {len(missing_articles)} articles missing from newsletter content")
@@ -3259,6 +3700,94 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
     # Quality filtering & deduplication helpers (re-added)
     # ------------------------------------------------------------------
 
+    def _article_quality_score(self, art: ProcessedArticle) -> float:
+        """Return the AI 関連度 of *art* adjusted by its source priority."""
+
+        try:
+            base_score = art.summarized_article.filtered_article.ai_relevance_score
+
+            # Add priority boost for official sources and filter low quality
+            try:
+                source_priority = getattr(art.summarized_article.filtered_article.raw_article, 'source_priority', 3)
+                if source_priority == 1:  # Official releases
+                    base_score += 0.4  # Very strong boost for official sources
+                elif source_priority == 2:  # Newsletters
+                    base_score += 0.2  # Strong boost for newsletters
+                elif source_priority == 4:  # Japanese/blog sources
+                    # Apply penalty unless score is very high
+                    if base_score < 0.7:
+                        base_score *= 0.8  # Reduce score for lower-quality sources
+                # Cap at 1.0
+                base_score = min(base_score, 1.0)
+            except Exception:
+                pass
+
+            return base_score
+        except Exception:
+            return 0.5  # neutral default
+
+    def _sorted_by_quality(
+        self,
+        articles: list[ProcessedArticle],
+    ) -> list[tuple[float, ProcessedArticle]]:
+        """Return ``(score, article)`` pairs sorted by quality score (desc).
+
+        Each article is scored exactly once; the sort is stable so articles
+        with equal scores keep their input order.
+        """
+
+        scored = [(self._article_quality_score(art), art) for art in articles]
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return scored
+
+    @staticmethod
+    def _relaxed_quality_floor(quality_threshold: float) -> float:
+        """Return the lowest score the threshold relaxation may admit.
+
+        Mirrors the former step-wise relaxation: up to three 10% reductions
+        (stopping below 0.15), then an emergency 30% cut that never goes below 0.1.
+        """
+
+        relaxed = quality_threshold
+        for _ in range(3):
+            relaxed *= 0.9
+            if relaxed < 0.15:
+                break
+        if relaxed > 0.1:
+            relaxed = max(0.1, relaxed * 0.7)
+        return relaxed
+
+    def _select_articles_by_quality(
+        self,
+        ranked_articles: list[tuple[float, ProcessedArticle]],
+        quality_threshold: float,
+        min_articles: int,
+    ) -> list[ProcessedArticle]:
+        """Select articles from ``(score, article)`` pairs sorted by score (desc).
+
+        Articles at or above *quality_threshold* are kept. When fewer than
+        *min_articles* pass, the best remaining articles top the list up, but only
+        down to ``_relaxed_quality_floor``. If none reach the floor, the top-ranked
+        articles are used so the newsletter is never empty.
+        """
+
+        selected = [art for score, art in ranked_articles if score >= quality_threshold]
+        if len(selected) >= min_articles:
+            return selected
+
+        floor = self._relaxed_quality_floor(quality_threshold)
+        if HAS_LOGGER:
+            logger.info(
+                "Insufficient articles above quality threshold, topping up down to the relaxed floor",
+                current_count=len(selected),
+                target_minimum=min_articles,
+                threshold=quality_threshold,
+                floor=floor
+            )
+
+        topped_up = [art for score, art in ranked_articles[:min_articles] if score >= floor]
+        return topped_up or [art for _, art in ranked_articles[:min_articles]]
+
     def _filter_articles_by_quality(
         self,
         articles: list[ProcessedArticle],
@@ -3274,45 +3803,28 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
         if not articles:
             return []
 
-        def _score(art: ProcessedArticle) -> float:
-            try:
-                base_score = art.summarized_article.filtered_article.ai_relevance_score
-
-                # Add priority boost for official sources and filter low quality
-                try:
-                    source_priority = getattr(art.summarized_article.filtered_article.raw_article, 'source_priority', 3)
-                    if source_priority == 1:  # Official releases
-                        base_score += 0.4  # Very strong boost for official sources
-                    elif source_priority == 2:  # Newsletters
-                        base_score += 0.2  # Strong boost for newsletters
-                    elif source_priority == 4:  # Japanese/blog sources
-                        # Apply penalty unless score is very high
-                        if base_score < 0.7:
-                            base_score *= 0.8  # Reduce score for lower-quality sources
-                    # Cap at 1.0
-                    base_score = min(base_score, 1.0)
-                except Exception:
-                    pass
-
-                return base_score
-            except Exception:
-                return 0.5  # neutral default
-
-        filtered = [a for a in articles if _score(a) >= quality_threshold]
+        ranked = self._sorted_by_quality(articles)
+        filtered = [art for score, art in ranked if score >= quality_threshold]
 
         # Always ensure at least one article remains to avoid empty newsletter
         if not filtered:
-            filtered = articles[:]
+            filtered = [art for _, art in ranked]
 
-        return sorted(filtered, key=_score, reverse=True)
+        return filtered
 
     def _deduplicate_articles(self, articles: list[ProcessedArticle]) -> list[ProcessedArticle]:
-        """Remove articles flagged as duplicates or with identical raw IDs."""
+        """Remove articles flagged as duplicates, with identical raw IDs, or near-identical text.
+
+        Near-duplicates are found with 64-bit SimHash fingerprints bucketed by
+        16-bit bands, so only articles sharing a band are compared.
+        """
 
         unique_articles = []
         seen_ids = set()
+        simhash_buckets: dict[tuple[int, int], list[int]] = {}
         duplicate_flagged = 0
         id_duplicates = 0
+        near_duplicates = 0
 
         for art in articles:
             try:
@@ -3343,6 +3855,28 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
                     logger.debug(f"Article with duplicate ID: {raw_id}")
                 continue
 
+            # Near-duplicate check: compare SimHash fingerprints only against
+            # articles sharing at least one band bucket
+            try:
+                raw_article = art.summarized_article.filtered_article.raw_article
+                fingerprint = _simhash(f"{raw_article.title}\n{raw_article.content[:500]}")
+            except Exception:
+                fingerprint = None
+
+            if fingerprint:
+                bands = _simhash_bands(fingerprint)
+                if any(
+                    (fingerprint ^ other).bit_count() <= _SIMHASH_MAX_DISTANCE
+                    for key in bands
+                    for other in simhash_buckets.get(key, ())
+                ):
+                    near_duplicates += 1
+                    if HAS_LOGGER:
+                        logger.debug(f"Article is a near-duplicate: {raw_id}")
+                    continue
+                for key in bands:
+                    simhash_buckets.setdefault(key, []).append(fingerprint)
+
             unique_articles.append(art)
             if raw_id:
                 seen_ids.add(raw_id)
@@ -3353,7 +3887,8 @@ JSONではなく、上記の形式で日本語の文章を直接生成してく
                 total_input=len(articles),
                 unique_output=len(unique_articles),
                 duplicate_flagged=duplicate_flagged,
-                id_duplicates=id_duplicates
+                id_duplicates=id_duplicates,
+                near_duplicates=near_duplicates
             )
 
         return unique_articles
@@ -3428,135 +3963,312 @@ async def generate_markdown_newsletter(
 # Module-level helper functions
 # ---------------------------------------------------------------------------
 
+# 目次切断で使用する区切り文字
+_END_CHARS = ('。', '！', '？')
+_COMMA_CHARS = ('、', '，')
+_CLOSE_CHARS = ('）', '」', '』')
+_CONJUNCTIONS = ('また', 'さらに', '一方', 'なお', 'ただし', 'しかし', 'そして')
+_PARTICLE_PREV_CHARS = ('の', 'で', 'も', 'や')
+_PARTICLE_PREV = frozenset(_PARTICLE_PREV_CHARS)
+_PARTICLE_NEXT = frozenset('はがをに')
+
+# 切断結果の末尾判定用（「から」のみ2文字なので別途判定）
+_SINGLE_PARTICLES = frozenset('はがをにでと')
+_TERMINAL_PUNCT = frozenset('。！？')
+_COMPLETE_ENDINGS = frozenset('。！？、）」』')
+
+
+class _CutStrategy(NamedTuple):
+    """目次切断ストラテジーの設定。"""
+
+    add_ellipsis: bool
+    description: str
+
+
+# 目次切断の優先度順ストラテジー（最小長は全ストラテジー共通で max(10, max_chars * 0.3)）
+_CUT_STRATEGIES = (
+    # 0. 完全な文境界（最優先）
+    _CutStrategy(False, '文末句読点'),
+    # 1. 自然な休止点
+    _CutStrategy(False, '読点'),
+    # 2. 括弧の外側（情報の完結性を保持）
+    _CutStrategy(False, '括弧終了'),
+    # 3. 接続詞の前（論理構造を保持）
+    _CutStrategy(True, '接続詞前'),
+    # 4. 助詞の後（最後の手段、但し「は」「が」等の直前は避ける）
+    _CutStrategy(True, '助詞後（安全な位置）'),
+)
+
+# 句読点・括弧をストラテジー番号のマーカー文字（\x01〜\x03）に写像する str.translate 用テーブル
+# 入力に元から含まれるマーカー文字は \x00 に潰して誤検出を防ぐ
+_STRATEGY_MARKERS = ('\x01', '\x02', '\x03')
+_MARKER_TABLE = {
+    **{ord(marker): '\x00' for marker in _STRATEGY_MARKERS},
+    **{
+        ord(char): marker
+        for marker, chars in zip(_STRATEGY_MARKERS, (_END_CHARS, _COMMA_CHARS, _CLOSE_CHARS))
+        for char in chars
+    },
+}
+_STRATEGY_CONJUNCTION = 3
+_STRATEGY_PARTICLE = 4
+
+# フォールバック時の安全な切断文字（_BOUNDARY_AFTER は文字の直後で切断）
+_SAFE_BOUNDARY = frozenset('\u3000 、，。！？）」』')
+_BOUNDARY_AFTER = frozenset('、，。！？）」』')
+
+
+def _find_cut_position(snippet: str, min_pos: int) -> tuple[int, int]:
+    """
+    優先度の最も高いストラテジーで、最も後ろの切断位置を求める。
+
+    句読点・括弧は str.translate でマーカー化した文字列への rfind、接続詞・助詞は
+    rfind で C レベルの走査に任せ、Python 側では候補位置の判定のみ行う。
+
+    Returns:
+        (ストラテジー番号, 切断位置)。*min_pos* 以上の候補がなければ (-1, -1)
+    """
+    # 句読点・括弧: 文字の直後で切断
+    marked = snippet.translate(_MARKER_TABLE)
+    for index, marker in enumerate(_STRATEGY_MARKERS):
+        cut_pos = marked.rfind(marker) + 1
+        if cut_pos >= min_pos:
+            return index, cut_pos
+
+    # 接続詞の前で切断
+    cut_pos = max(snippet.rfind(conjunction) for conjunction in _CONJUNCTIONS)
+    if cut_pos >= min_pos:
+        return _STRATEGY_CONJUNCTION, cut_pos
+
+    # 助詞の後で切断（直後が空白＋「は」「が」等なら避ける）
+    length = len(snippet)
+    end = length
+    while True:
+        i = max(snippet.rfind(char, 0, end) for char in _PARTICLE_PREV_CHARS)
+        if i < min_pos - 1:
+            break
+        j = i + 1
+        while j < length and snippet[j].isspace():
+            j += 1
+        if j == length or snippet[j] not in _PARTICLE_NEXT:
+            return _STRATEGY_PARTICLE, i + 1
+        end = i
+
+    return -1, -1
+
+
 def ensure_sentence_completeness(text: str, max_chars: int = None) -> str:
     """
     日本語に最適化された文境界検出による自然な切断処理。
     目次の可読性を最大化するため、適切な切断点を優先度順に探索。
     """
 
+    if not text:
+        return ""
+
     # Use TEXT_LIMITS default if max_chars not specified
     if max_chars is None:
         max_chars = TEXT_LIMITS.get('title_short', 120)
 
-    if not text:
-        return ""
-
+    # 切断不要な場合（最も多いケース）は切断位置の探索を一切行わずに返す
     if len(text) <= max_chars:
         return text
 
-    snippet = text[:max_chars]
+    return _truncate_at_boundary(text, max_chars)
 
-    # 優先度順の切断ポイント定義
-    cut_strategies = [
-        # 1. 完全な文境界（最優先）
-        {
-            'patterns': [r'[。！？]'],
-            'include_match': True,
-            'min_length_ratio': 0.3,
-            'add_ellipsis': False,
-            'description': '文末句読点'
-        },
-
-        # 2. 自然な休止点
-        {
-            'patterns': [r'[、，]'],
-            'include_match': True,
-            'min_length_ratio': 0.4,
-            'add_ellipsis': False,
-            'description': '読点'
-        },
-
-        # 3. 括弧の外側（情報の完結性を保持）
-        {
-            'patterns': [r'[）」』]'],
-            'include_match': True,
-            'min_length_ratio': 0.3,
-            'add_ellipsis': False,
-            'description': '括弧終了'
-        },
-
-        # 4. 接続詞の前（論理構造を保持）
-        {
-            'patterns': [r'(?=また|さらに|一方|なお|ただし|しかし|そして)'],
-            'include_match': False,
-            'min_length_ratio': 0.4,
-            'add_ellipsis': True,
-            'description': '接続詞前'
-        },
-
-        # 5. 助詞の後（最後の手段、但し不完全感を避ける）
-        {
-            'patterns': [r'(?<=[のでもや])(?!\s*[はがをに])'],  # 「は」「が」等の直前は避ける
-            'include_match': False,
-            'min_length_ratio': 0.5,
-            'add_ellipsis': True,
-            'description': '助詞後（安全な位置）'
-        }
-    ]
+
+def _trim_tail(snippet: str, end: int) -> int:
+    """
+    snippet[:end] から末尾の空白を除き、不完全な助詞で終わる場合はその1文字と
+    直前の空白も除いた終端位置を返す。
+    """
+    while end > 0 and snippet[end - 1].isspace():
+        end -= 1
+
+    if end > 0 and (snippet[end - 1] in _SINGLE_PARTICLES or snippet.endswith('から', 0, end)):
+        end -= 1
+        while end > 0 and snippet[end - 1].isspace():
+            end -= 1
+
+    return end
+
+
+def _has_remaining_content(text: str, cut_pos: int) -> bool:
+    """Return True if the stripped remainder of *text* after *cut_pos* exceeds 8 chars."""
+    # 残り文字数が少なければ strip のための切り出しは不要
+    return len(text) - cut_pos > 8 and len(text[cut_pos:].strip()) > 8
+
+
+@lru_cache(maxsize=4096)
+def _truncate_at_boundary(text: str, max_chars: int) -> str:
+    """
+    *max_chars* を超える *text* を最適な切断点で切り詰める。
+
+    同じ記事の要約は再生成やリトライで繰り返し切断されるため、結果をキャッシュする。
+    """
+    snippet = text[:max_chars]
 
     min_acceptable_length = max(10, int(max_chars * 0.3))
 
-    # 各戦略を試行
-    for strategy in cut_strategies:
-        for pattern in strategy['patterns']:
-            matches = list(re.finditer(pattern, snippet))
-            if matches:
-                # 最後のマッチを使用
-                last_match = matches[-1]
-                cut_pos = last_match.end() if strategy['include_match'] else last_match.start()
-
-                # 最小長要件チェック
-                if cut_pos >= min_acceptable_length:
-                    result = snippet[:cut_pos].rstrip()
-
-                    # 不完全な助詞で終わる場合は修正
-                    if result.endswith(('は', 'が', 'を', 'に', 'で', 'と', 'から')):
-                        result = result[:-1].rstrip()
-
-                    # 残りコンテンツの確認
-                    remaining = text[cut_pos:].strip()
-                    needs_ellipsis = (
-                        strategy['add_ellipsis'] and
-                        remaining and
-                        len(remaining) > 8 and
-                        not result.endswith(('。', '！', '？'))
-                    )
+    # 優先度順に切断位置を探索し、見つかった場合は省略記号の要否のみ判定
+    strategy_index, cut_pos = _find_cut_position(snippet, min_acceptable_length)
+    if strategy_index >= 0:
+        strategy = _CUT_STRATEGIES[strategy_index]
+        # 末尾の空白と不完全な助詞を除いた位置で一度だけ切り出す
+        result = snippet[:_trim_tail(snippet, cut_pos)]
+
+        # 残りコンテンツの確認（安価な判定から順に評価し、末尾の切り出しは必要時のみ）
+        needs_ellipsis = (
+            strategy.add_ellipsis and
+            result[-1:] not in _TERMINAL_PUNCT and
+            _has_remaining_content(text, cut_pos)
+        )
 
-                    final_result = result + ('…' if needs_ellipsis else '')
+        final_result = result + ('…' if needs_ellipsis else '')
 
-                    # デバッグログ（目次の品質確認用）
-                    logger.debug(
-                        f"TOC truncation: '{strategy['description']}' at {cut_pos}/{max_chars} chars"
-                    )
+        # デバッグログ（目次の品質確認用）
+        logger.debug(
+            "TOC truncation: '%s' at %d/%d chars", strategy.description, cut_pos, max_chars
+        )
+
+        return final_result
+
+    # フォールバック：安全な位置での切断、なければ単純切断
+    return _truncate_cold(text, snippet, min_acceptable_length)
 
-                    return final_result
 
-    # フォールバック：安全な位置での切断
-    # 単語境界を探す（日本語では空白や句読点）
-    safe_positions = []
+def _truncate_cold(text: str, snippet: str, min_acceptable_length: int) -> str:
+    """
+    どのストラテジーでも切断位置が見つからない場合のフォールバック切断。
+
+    単語境界（日本語では空白や句読点、助詞の後）を末尾から一度だけ走査し、
+    同じ走査の中で最終手段の単純切断位置も記録する。
+    """
+    simple_start = len(snippet) - 3
+    simple_cut = -1
+    cut_pos = -1
+
+    # 最も後ろの安全な位置が見つかった時点で走査を終了
     for i in range(len(snippet) - 1, min_acceptable_length, -1):
         char = snippet[i]
-        if char in '　 、，。！？）」』':
-            safe_positions.append(i + (1 if char in '、，。！？）」』' else 0))
-        elif i > 0 and snippet[i-1] in 'のでもや' and char not in 'はがをに':
-            safe_positions.append(i)
-
-    if safe_positions:
-        cut_pos = safe_positions[0]  # 最も後ろの安全な位置
+        if char in _SAFE_BOUNDARY:
+            cut_pos = i + (1 if char in _BOUNDARY_AFTER else 0)
+            break
+        if snippet[i - 1] in _PARTICLE_PREV and char not in _PARTICLE_NEXT:
+            cut_pos = i
+            break
+        # 単純切断用：末尾3文字手前から「は」「が」等以外の最初の位置
+        if simple_cut < 0 and i <= simple_start and char not in _PARTICLE_NEXT:
+            simple_cut = i
+
+    if cut_pos >= 0:
         result = snippet[:cut_pos].rstrip()
 
         # 最終的な品質チェック
-        if not result.endswith(('。', '！', '？', '、', '）', '」', '』')):
-            remaining = text[cut_pos:].strip()
-            if remaining and len(remaining) > 8:
-                result += '…'
+        if result[-1:] not in _COMPLETE_ENDINGS and _has_remaining_content(text, cut_pos):
+            result += '…'
 
         return result
 
     # 最終フォールバック：単純切断
-    fallback_pos = max_chars - 3
-    while fallback_pos > min_acceptable_length and snippet[fallback_pos] in 'はがをに':
-        fallback_pos -= 1
+    if simple_cut < 0:
+        simple_cut = min(simple_start, min_acceptable_length)
+
+    return snippet[:simple_cut].rstrip() + '…'
+
+
+# 近似重複検出用 SimHash（64bit）
+# ハミング距離 3 以下を重複とみなす。16bit×4 バンドに分割すると、距離 3 以下の
+# 組は鳩の巣原理で必ずいずれかのバンドが一致するため、同一バンドのバケット内だけ比較すればよい
+_SIMHASH_BITS = 64
+_SIMHASH_MAX_DISTANCE = 3
+_SIMHASH_BANDS = 4
+_SIMHASH_BAND_BITS = _SIMHASH_BITS // _SIMHASH_BANDS
+_SIMHASH_SHINGLE = 3  # 日本語にも使える文字 3-gram
+
+
+def _simhash(text: str) -> int:
+    """Return the 64-bit SimHash of *text* built from character shingles."""
+    text = _RE_WHITESPACE_RUN.sub(' ', text.lower()).strip()
+    if not text:
+        return 0
+
+    # 同じシングルは出現回数を重みとして 1 回だけハッシュする
+    weights: dict[str, int] = {}
+    for i in range(max(1, len(text) - _SIMHASH_SHINGLE + 1)):
+        shingle = text[i:i + _SIMHASH_SHINGLE]
+        weights[shingle] = weights.get(shingle, 0) + 1
+
+    vector = [0] * _SIMHASH_BITS
+    for shingle, weight in weights.items():
+        h = int.from_bytes(
+            hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big'
+        )
+        for bit in range(_SIMHASH_BITS):
+            vector[bit] += weight if (h >> bit) & 1 else -weight
+
+    fingerprint = 0
+    for bit, value in enumerate(vector):
+        if value > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def _simhash_bands(fingerprint: int) -> list[tuple[int, int]]:
+    """Split *fingerprint* into ``(band_index, band_value)`` bucket keys."""
+    mask = (1 << _SIMHASH_BAND_BITS) - 1
+    return [
+        (band, (fingerprint >> (band * _SIMHASH_BAND_BITS)) & mask)
+        for band in range(_SIMHASH_BANDS)
+    ]
+
 
-    return snippet[:fallback_pos].rstrip() + '…'
+@lru_cache(maxsize=512)
+def _fallback_companies(title: str) -> frozenset[str]:
+    """フォールバックリード文用に *title* に含まれる主要企業名を返す。"""
+    return frozenset(_RE_FALLBACK_COMPANY.findall(title))
+
+
+def _strip_sequel_marker(text: str) -> str:
+    """*text* から【続報】/続報: などの続報表記を除去する。
+
+    _RE_SEQUEL_PREFIX は括弧・コロンの有無を問わず全ての「続報」を除去するため、
+    後続の位置別パターンは除去で新たに「続報」が繋がった場合にしか一致しない。
+    その稀なケースでのみ追加の走査を行う。
+    """
+    text = _RE_SEQUEL_PREFIX.sub('', text)
+    if '続報' in text:
+        text = _RE_SEQUEL_LEADING.sub('', text)
+        text = _RE_SEQUEL_INLINE.sub('', text)
+        text = _RE_SEQUEL_TRAILING.sub('', text)
+    return text
 
+
+def _strip_suffix(text: str, suffixes: tuple[str, ...]) -> str:
+    """*text* 末尾の *suffixes* のいずれか一つを除去する。
+
+    ``re.sub('(?:a|b)$', '', text)`` と同じ位置で一致させるため、末尾が改行なら
+    その直前を末尾とみなす（``$`` の挙動）。正規表現のように全位置を試さず、
+    str.endswith の一回の比較で済む。
+    """
+    body = text[:-1] if text.endswith('\n') else text
+    if body.endswith(suffixes):
+        for suffix in suffixes:
+            if body.endswith(suffix):
+                return body[:-len(suffix)] + text[len(body):]
+    return text
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """*data* を一時ファイル経由で *path* に書き込む。
+
+    書き込み後に os.replace で置き換えるため、途中でクラッシュしても既存の
+    ファイルが壊れることはない。失敗時は一時ファイルを削除して例外を再送出する。
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -37,6 +37,37 @@ class QualityReport:
     metrics: dict[str, Any]
 
 
+@dataclass(frozen=True)
+class NewsletterLine:
+    """A single newsletter line classified by its markdown role."""
+    kind: str  # 'title', 'header', 'rule', 'blank', 'text'
+    text: str  # Line as written (without the newline)
+    stripped: str  # Line with surrounding whitespace removed
+
+
+def tokenize_newsletter(content: str) -> list[NewsletterLine]:
+    """Split *content* into classified lines in a single pass.
+
+    The result can be shared by every consumer that walks the newsletter line
+    by line, so the rendered markdown is only split once.
+    """
+    lines = []
+    for line in content.split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            kind = 'blank'
+        elif line.startswith('# ') and len(line) > 2:
+            kind = 'title'
+        elif stripped.startswith('#'):
+            kind = 'header'
+        elif stripped == '---':
+            kind = 'rule'
+        else:
+            kind = 'text'
+        lines.append(NewsletterLine(kind, line, stripped))
+    return lines
+
+
 class NewsletterQualityChecker:
     """Comprehensive newsletter quality validation system."""
 
@@ -83,8 +114,11 @@ class NewsletterQualityChecker:
         section_scores = {}
         metrics = {}
 
+        # Tokenize once; section parsing and the structure check share the lines
+        lines = tokenize_newsletter(content)
+
         # Parse newsletter sections
-        sections = self._parse_newsletter_sections(content)
+        sections = self._parse_newsletter_sections(lines)
 
         # Check each section
         lead_issues, lead_score = await self._check_lead_text(sections.get('lead', ''))
@@ -104,7 +138,7 @@ class NewsletterQualityChecker:
         section_scores['citations'] = citations_score
 
         # Overall structure check
-        structure_issues, structure_score = self._check_overall_structure(content)
+        structure_issues, structure_score = self._check_overall_structure(content, lines)
         issues.extend(structure_issues)
         section_scores['structure'] = structure_score
 
@@ -141,8 +175,8 @@ class NewsletterQualityChecker:
             metrics=metrics
         )
 
-    def _parse_newsletter_sections(self, content: str) -> dict[str, Any]:
-        """Parse newsletter into identifiable sections."""
+    def _parse_newsletter_sections(self, lines: list[NewsletterLine]) -> dict[str, Any]:
+        """Parse tokenized newsletter lines into identifiable sections."""
         sections = {
             'lead': '',
             'toc': '',
@@ -150,12 +184,12 @@ class NewsletterQualityChecker:
             'citations': []
         }
 
-        lines = content.split('\n')
         current_section = None
         current_article = None
 
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
+        for i, record in enumerate(lines):
+            line = record.text
+            line_stripped = record.stripped
 
             # Identify section headers
             if line_stripped.startswith('# '):
@@ -174,16 +208,16 @@ class NewsletterQualityChecker:
                 }
                 current_section = 'article'
                 continue
-            elif line_stripped == '---':
+            elif record.kind == 'rule':
                 current_section = 'articles_start'
                 continue
 
             # Collect content based on current section
-            if current_section == 'toc' and line_stripped and not line_stripped.startswith('#'):
+            if current_section == 'toc' and record.kind == 'text':
                 sections['toc'] += line + '\n'
             elif current_section == 'article' and current_article:
                 current_article['content'] += line + '\n'
-            elif current_section is None and line_stripped and not line_stripped.startswith('#'):
+            elif current_section is None and record.kind == 'text':
                 # This is likely lead text
                 sections['lead'] += line + '\n'
 
@@ -372,7 +406,11 @@ class NewsletterQualityChecker:
 
         return issues, score
 
-    def _check_overall_structure(self, content: str) -> tuple[list[QualityIssue], float]:
+    def _check_overall_structure(
+        self,
+        content: str,
+        lines: list[NewsletterLine]
+    ) -> tuple[list[QualityIssue], float]:
         """Check overall newsletter structure."""
         issues = []
         score = 1.0
@@ -392,7 +430,7 @@ class NewsletterQualityChecker:
                 score -= 0.2
 
         # Check for proper markdown formatting
-        if not re.search(r'^# .+', content, re.MULTILINE):
+        if not any(line.kind == 'title' for line in lines):
             issues.append(QualityIssue(
                 severity='major',
                 category='formatting',
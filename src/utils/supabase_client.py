@@ -686,7 +686,8 @@ async def save_article_relationship(
 async def get_recent_contextual_articles(
     days_back: int = 7,
     limit: int = 1000,
-    client: SupabaseClient | None = None
+    client: SupabaseClient | None = None,
+    include_embedding: bool = True
 ) -> list[dict]:
     """
     Get recent contextual articles with embeddings.
@@ -695,6 +696,7 @@ async def get_recent_contextual_articles(
         days_back: Number of days to look back
         limit: Maximum number of articles to return
         client: Optional existing Supabase client
+        include_embedding: Whether to fetch the (large) embedding column
 
     Returns:
         List of contextual articles with metadata
@@ -713,11 +715,17 @@ async def get_recent_contextual_articles(
         # Calculate cutoff date
         cutoff_date = datetime.now() - timedelta(days=days_back)
 
-        # Query contextual articles with embeddings
-        result = client.client.table("contextual_articles").select(
+        columns = (
             "id, article_id, title, content_summary, published_date, source_id, "
             "ai_relevance_score, summary_points, japanese_title, is_update, "
-            "topic_cluster, embedding"
+            "topic_cluster"
+        )
+        if include_embedding:
+            columns += ", embedding"
+
+        # Query contextual articles (optionally with embeddings)
+        result = client.client.table("contextual_articles").select(
+            columns
         ).gte(
             "published_date", cutoff_date.isoformat()
         ).order(
@@ -613,13 +613,13 @@ class NewsletterWorkflow:
             )
 
             # Reset URL tracking for newsletter-wide citation deduplication
-            citation_deduplicator = CitationGenerator()
+            citation_deduplicator = CitationGenerator(self.llm_router)
             citation_deduplicator.reset_url_tracking()
             logger.info("Citation URL tracking reset for new newsletter generation")
 
             # PRD F-15準拠: クラスタ情報を活用した引用生成
             from src.utils.citation_generator import CitationGenerator
-            citation_generator = CitationGenerator()
+            citation_generator = CitationGenerator(self.llm_router)
 
             # 各記事にクラスタ内の関連記事情報を渡して引用生成
             for i, article in enumerate(clustered_articles):
@@ -826,13 +826,13 @@ class NewsletterWorkflow:
             )
 
             # Reset URL tracking for newsletter-wide citation deduplication
-            citation_deduplicator = CitationGenerator()
+            citation_deduplicator = CitationGenerator(self.llm_router)
             citation_deduplicator.reset_url_tracking()
             logger.info("Citation URL tracking reset for new newsletter generation")
 
             # PRD F-15準拠: クラスタ情報を活用した引用生成
             from src.utils.citation_generator import CitationGenerator
-            citation_generator = CitationGenerator()
+            citation_generator = CitationGenerator(self.llm_router)
 
             # 各記事にクラスタ内の関連記事情報を渡して引用生成
             for i, article in enumerate(clustered_articles):
@@ -1324,7 +1324,7 @@ class NewsletterWorkflow:
             # This ensures all processing including multi-source consolidation is executed
             from src.utils.newsletter_generator import NewsletterGenerator
 
-            generator = NewsletterGenerator(templates_dir="src/templates")
+            generator = NewsletterGenerator(templates_dir="src/templates", llm_router=self.llm_router)
             newsletter_output = await generator.generate_newsletter(
                 articles=articles,
                 edition=config.edition,
@@ -0,0 +1,295 @@
+"""
+Test suite for the newsletter generator.
+
+This module tests title post-processing and the caching, deduplication and
+selection helpers of NewsletterGenerator without calling real LLM providers.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import newsletter_generator
+from src.utils.newsletter_generator import NewsletterGenerator
+
+
+class StubLLMRouter:
+    """Returns canned responses in order and counts the calls made."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def generate_simple_text(self, prompt, max_tokens=None, temperature=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def _lead_response(company):
+    """JSON lead text response whose first paragraph names *company*."""
+    return json.dumps({"lead_paragraphs": [
+        f"{company}は新しい推論モデルを公開し、開発者向けの提供を開始しました。",
+        "Googleも検索体験を強化する生成AI機能を発表しています。",
+        "各社の競争は今後さらに激しくなる見込みです。",
+    ]}, ensure_ascii=False)
+
+
+def _article(article_id, title, content):
+    """Minimal stand-in for a ProcessedArticle as read by _deduplicate_articles."""
+    raw_article = SimpleNamespace(id=article_id, title=title, content=content)
+    return SimpleNamespace(
+        summarized_article=SimpleNamespace(filtered_article=SimpleNamespace(raw_article=raw_article)),
+        duplicate_check=None,
+    )
+
+
+_RELEASE_TEXT = (
+    "OpenAI released a new reasoning model today. The model improves coding benchmarks "
+    "and is available to developers through the API, with pricing lowered for high volume customers. "
+) * 2
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """NewsletterGenerator whose on-disk caches live under tmp_path."""
+    with patch.dict(os.environ, {
+        "OPENAI_API_KEY": "test-openai",
+        "GEMINI_API_KEY": "test-gemini",
+        "SUPABASE_URL": "http://localhost",
+        "SUPABASE_KEY": "test-supabase",
+    }):
+        gen = NewsletterGenerator()
+    gen.past_embedding_cache_dir = tmp_path / "context_cache"
+    gen.update_decision_cache_path = tmp_path / "cache" / "update_decisions.json"
+    return gen
+
+
+def test_improve_title_completes_trailing_ellipsis(generator):
+    """A title cut off with '...' is completed instead of raising."""
+    validation = generator._validate_title_quality("OpenAIが新モデル...")
+
+    assert generator._improve_title_based_on_validation("OpenAIが新モデル...", validation) == "OpenAIが新モデルを発表"
+    # Titles that already read complete are left as they are
+    assert generator._improve_title_based_on_validation("新モデルを公開した...", validation) == "新モデルを公開した"
+
+
+def test_lead_text_retry_stops_at_first_valid_answer(generator):
+    """A valid first answer costs exactly one LLM call."""
+    generator.llm_router = StubLLMRouter([_lead_response("Anthropic"), _lead_response("Meta")])
+    generator._build_lead_text_prompt = lambda articles, edition: "prompt"
+
+    result = asyncio.run(generator._generate_llm_lead_text_with_retry([], "daily"))
+
+    assert generator.llm_router.calls == 1
+    assert result["lead_paragraphs"][0].startswith("Anthropic")
+
+
+def test_lead_text_retry_sends_next_request_only_after_failure(generator):
+    """Attempts are sequential and the first valid answer wins."""
+    invalid = json.dumps({"lead_paragraphs": ["短い", "短い"]}, ensure_ascii=False)
+    generator.llm_router = StubLLMRouter([invalid, _lead_response("Anthropic"), _lead_response("Meta")])
+    generator._build_lead_text_prompt = lambda articles, edition: "prompt"
+
+    result = asyncio.run(generator._generate_llm_lead_text_with_retry([], "daily"))
+
+    assert generator.llm_router.calls == 2
+    assert result["lead_paragraphs"][0].startswith("Anthropic")
+
+
+def test_deduplicate_drops_near_identical_articles(generator):
+    """Case, whitespace and punctuation variants of the same story are near-duplicates."""
+    articles = [
+        _article("a", "OpenAI launches model", _RELEASE_TEXT),
+        _article("b", "OpenAI  launches MODEL", _RELEASE_TEXT.replace("today.", "today!")),
+    ]
+
+    assert [a.summarized_article.filtered_article.raw_article.id
+            for a in generator._deduplicate_articles(articles)] == ["a"]
+
+
+def test_deduplicate_keeps_distinct_and_empty_articles(generator):
+    """Different stories and articles without text (no fingerprint) are all kept."""
+    articles = [
+        _article("a", "OpenAI launches model", _RELEASE_TEXT),
+        _article("b", "Google unveils chip", "Google announced a new TPU generation for training "
+                 "large models, promising twice the throughput per watt. " * 2),
+        _article("c", "", ""),
+        _article("d", "", ""),
+        _article("e", "No body", None),
+    ]
+
+    kept = generator._deduplicate_articles(articles)
+
+    assert [a.summarized_article.filtered_article.raw_article.id for a in kept] == ["a", "b", "c", "d", "e"]
+
+
+def test_deduplicate_hamming_threshold_and_band_buckets(generator, monkeypatch):
+    """Distance <= 3 always shares a band and is dropped; distance 4 across all bands is kept."""
+    band_bits = newsletter_generator._SIMHASH_BAND_BITS
+    base = 0x0123456789ABCDEF
+    within = base ^ (1 | 1 << band_bits | 1 << 2 * band_bits)  # 3 bits, bands 0-2 differ
+    beyond = base ^ (1 | 1 << band_bits | 1 << 2 * band_bits | 1 << 3 * band_bits)  # 4 bits, every band differs
+    fingerprints = {"base": base, "within": within, "beyond": beyond}
+    monkeypatch.setattr(newsletter_generator, "_simhash", lambda text: fingerprints[text.split("\n")[0]])
+
+    assert set(newsletter_generator._simhash_bands(base)) & set(newsletter_generator._simhash_bands(within))
+    assert not set(newsletter_generator._simhash_bands(base)) & set(newsletter_generator._simhash_bands(beyond))
+
+    kept = generator._deduplicate_articles([
+        _article("1", "base", ""),
+        _article("2", "within", ""),
+        _article("3", "beyond", ""),
+    ])
+
+    assert [a.summarized_article.filtered_article.raw_article.id for a in kept] == ["1", "3"]
+
+
+def test_quality_top_up_respects_relaxed_floor(generator):
+    """Top-up admits below-threshold articles only down to the relaxed floor."""
+    ranked = [(0.9, "a"), (0.5, "b"), (0.2, "c"), (0.05, "d"), (0.01, "e")]
+
+    floor = generator._relaxed_quality_floor(0.35)
+    assert 0.1 <= floor < 0.2  # 0.35 * 0.9**3 * 0.7
+    assert generator._select_articles_by_quality(ranked, 0.35, 10) == ["a", "b", "c"]
+    # Enough articles above the threshold: no top-up at all
+    assert generator._select_articles_by_quality(ranked, 0.35, 2) == ["a", "b"]
+
+
+def test_quality_top_up_never_returns_empty(generator):
+    """If nothing reaches the floor, the top-ranked articles are still used."""
+    ranked = [(0.05, "d"), (0.01, "e")]
+
+    assert generator._relaxed_quality_floor(0.12) == pytest.approx(0.1)  # emergency minimum
+    assert generator._select_articles_by_quality(ranked, 0.35, 10) == ["d", "e"]
+
+
+def test_update_decision_cache_hit_miss_and_persistence(generator, monkeypatch):
+    """Decisions are cached per pair, saved atomically and reloaded on the next run."""
+    monkeypatch.setattr(newsletter_generator, "HAS_LLM_ROUTER", True)
+    generator.llm_router = StubLLMRouter(["UPDATE", "UNRELATED"])
+    current = SimpleNamespace(summarized_article=SimpleNamespace(
+        filtered_article=SimpleNamespace(raw_article=SimpleNamespace(title="GPT-5 rollout expands")),
+        summary=SimpleNamespace(summary_points=["GPT-5が全ユーザーに提供されました。"]),
+    ))
+    past = {"title": "GPT-5 announced", "content_summary": "OpenAIがGPT-5を発表しました。"}
+
+    # Miss: the LLM is asked once
+    assert asyncio.run(generator._confirm_update_with_llm(current, past)) == "UPDATE"
+    assert (generator.llm_router.calls, generator.update_decision_cache_misses) == (1, 1)
+
+    # Hit: the same pair is answered from the cache
+    assert asyncio.run(generator._confirm_update_with_llm(current, past)) == "UPDATE"
+    assert (generator.llm_router.calls, generator.update_decision_cache_hits) == (1, 1)
+
+    # Round-trip: a fresh load from disk still answers without the LLM
+    generator._save_update_decision_cache()
+    assert not generator.update_decision_cache_path.with_name("update_decisions.json.tmp").exists()
+    generator._update_decision_cache = None
+    assert asyncio.run(generator._confirm_update_with_llm(current, past)) == "UPDATE"
+    assert generator.llm_router.calls == 1
+
+
+def test_past_embedding_cache_round_trip(generator):
+    """Matrices are stored as float16 and come back as float32 with their positions."""
+    np = pytest.importorskip("numpy")
+    matrix = np.random.default_rng(0).standard_normal((3, 8)).astype(np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    generator._save_past_embedding_cache("key", matrix, [0, 2, 5])
+    assert np.load(generator.past_embedding_cache_dir / "key.npy").dtype == np.float16
+
+    loaded, positions = generator._load_past_embedding_cache("key")
+    assert loaded.dtype == np.float32
+    assert np.allclose(loaded, matrix, atol=1e-3)
+    assert positions == [0, 2, 5]
+    assert generator._load_past_embedding_cache("other") is None
+
+
+def test_past_embedding_cache_rejects_mismatch_and_keeps_unrelated_files(generator):
+    """A shape/positions mismatch is a miss; only other cache pairs are pruned on save."""
+    np = pytest.importorskip("numpy")
+    cache_dir = generator.past_embedding_cache_dir
+    generator._save_past_embedding_cache("old", np.ones((2, 4), dtype=np.float32), [0, 1])
+    (cache_dir / "notes.txt").write_text("keep", encoding="utf-8")
+
+    generator._save_past_embedding_cache("new", np.ones((2, 4), dtype=np.float32), [0, 1])
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["new.json", "new.npy", "notes.txt"]
+
+    (cache_dir / "new.json").write_text("[0, 1, 2]", encoding="utf-8")
+    assert generator._load_past_embedding_cache("new") is None
+
+
+@pytest.mark.parametrize("current, past, related", [
+    # True update: same launch, wider rollout
+    ("OpenAI、GPT-5を全ユーザーに提供開始 OpenAIはGPT-5の提供を無料ユーザーを含む全ユーザーに拡大しました。"
+     "推論性能の向上によりコーディング能力が改善されています。",
+     "OpenAIがGPT-5を発表 OpenAIは次世代モデルGPT-5を発表し、有料ユーザー向けに提供を開始しました。"
+     "推論性能とコーディング能力が向上しています。",
+     True),
+    # True update: funding talks, then the closed round
+    ("Anthropic raises Series F at $183B valuation Anthropic closed its Series F funding round led by ICONIQ.",
+     "Anthropic in talks to raise funding at $170B valuation Anthropic is in talks with investors for a new funding round.",
+     True),
+    # Different stories about the same company
+    ("OpenAI、GPT-5を全ユーザーに提供開始 OpenAIはGPT-5の提供を全ユーザーに拡大しました。",
+     "OpenAIがインドにオフィス開設 OpenAIはニューデリーに新拠点を開設し、現地採用を開始すると発表しました。",
+     False),
+])
+def test_update_lexical_prefilter(current, past, related):
+    """Known update pairs reach LLM confirmation; unrelated same-company stories do not."""
+    assert NewsletterGenerator._lexically_related(
+        NewsletterGenerator._char_trigrams(current), NewsletterGenerator._char_trigrams(past)
+    ) is related
+
+
+def test_save_newsletter_removes_temp_file_on_failure(generator, tmp_path):
+    """A failed rename leaves neither the newsletter nor its .tmp sibling behind."""
+    date = datetime(2025, 8, 15, 7, 30)
+
+    with patch.object(newsletter_generator.os, "replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            generator._save_newsletter("# AI NEWS", date, "daily", str(tmp_path / "out"))
+
+    assert list((tmp_path / "out").iterdir()) == []
+
+    saved = generator._save_newsletter("# AI NEWS", date, "daily", str(tmp_path / "out"))
+    assert saved.read_text(encoding="utf-8") == "# AI NEWS"
+    assert [p.name for p in (tmp_path / "out").iterdir()] == ["2025-08-15_0730_daily_newsletter.md"]
+
+
+def test_is_debug_enabled_follows_root_level():
+    """The debug gate works with the real structlog logger and tracks the stdlib level."""
+    root = logging.getLogger()
+    previous = root.level
+    try:
+        root.setLevel(logging.INFO)
+        assert newsletter_generator._is_debug_enabled() is False
+        root.setLevel(logging.DEBUG)
+        assert newsletter_generator._is_debug_enabled() is True
+    finally:
+        root.setLevel(previous)
+
+
+
+def test_clean_title_with_annual_dollar_amount(generator):
+    """Currency titles that hit the debug log branch are cleaned without raising."""
+    title = "OpenAI、年間収益1000万ドルを突破と発表しました"
+
+    assert generator._clean_llm_generated_title(title) == "OpenAI、年間収益1000万ドルを突破"
+
+
+def test_generate_newsletter_without_citation_generator(generator, tmp_path, monkeypatch):
+    """A full run works when CitationGenerator is unavailable and reaches the debug-gated logging."""
+    monkeypatch.chdir(tmp_path)  # backup_file() writes under ./backups
+    generator.citation_generator = None
+
+    output = asyncio.run(generator.generate_newsletter([], output_dir=str(tmp_path / "drafts")))
+
+    assert output.articles == []
+    assert list((tmp_path / "drafts").glob("*_daily_newsletter.md"))
@@ -0,0 +1,48 @@
+"""
+Test suite for the newsletter quality checker.
+
+This module tests the shared line tokenizer and the section parser that
+consumes its line kinds.
+"""
+
+from src.utils.newsletter_quality_checker import NewsletterQualityChecker, tokenize_newsletter
+
+_NEWSLETTER = """# AI NEWS TLDR / 2025年08月15日
+
+OpenAIがGPT-5を全ユーザーに提供開始しました。
+
+## 目次
+
+1. GPT-5が全ユーザーに提供開始
+  ### 補足
+
+---
+
+### GPT-5が全ユーザーに提供開始
+
+- OpenAIはGPT-5の提供を拡大しました。
+> **参考**: https://example.com/gpt-5
+"""
+
+
+def test_tokenize_newsletter_classifies_lines():
+    """Each line keeps its text and is classified by its markdown role."""
+    lines = tokenize_newsletter(_NEWSLETTER)
+
+    assert [line.kind for line in lines] == [
+        'title', 'blank', 'text', 'blank', 'header', 'blank', 'text', 'header',
+        'blank', 'rule', 'blank', 'header', 'blank', 'text', 'text', 'blank',
+    ]
+    assert lines[7].text == "  ### 補足"
+    assert lines[7].stripped == "### 補足"
+    # A bare '# ' is not a title
+    assert [line.kind for line in tokenize_newsletter("# \n#タグ")] == ['header', 'header']
+
+
+def test_parse_newsletter_sections_uses_line_kinds():
+    """Lead and TOC collect only text lines; the rule ends the TOC."""
+    sections = NewsletterQualityChecker()._parse_newsletter_sections(tokenize_newsletter(_NEWSLETTER))
+
+    assert sections['lead'] == "OpenAIがGPT-5を全ユーザーに提供開始しました。\n"
+    assert sections['toc'] == "1. GPT-5が全ユーザーに提供開始\n"
+    assert sections['articles'] == []
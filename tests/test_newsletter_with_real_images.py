@@ -119,7 +119,7 @@ async def create_test_newsletter_with_real_images():
             return False
 
         # Setup Jinja2 environment
-        env = Environment(loader=FileSystemLoader('src/templates'))
+        env = Environment(loader=FileSystemLoader('src/templates'), trim_blocks=True, lstrip_blocks=True)
 
         # Define custom filter
         def toc_format(value):